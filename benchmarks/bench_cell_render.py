@@ -0,0 +1,64 @@
+"""Compare the single-pass cell renderer against the previous regex cascade.
+
+Usage: python benchmarks/bench_cell_render.py [rows]
+"""
+import html
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from md_table_to_html import process_cell_content
+
+def legacy_process_cell_content(text):
+    """The previous implementation: one re.sub pass per construct."""
+    text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
+    text = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', text)
+    text = re.sub(r'__(.*?)__', r'<strong>\1</strong>', text)
+    text = re.sub(r'(?<!\*)\*(?!\*)(.*?)\*(?<!\*)', r'<em>\1</em>', text)
+    text = re.sub(r'_(.*?)_', r'<em>\1</em>', text)
+    text = re.sub(r'`(.*?)`', r'<code>\1</code>', text)
+    text = re.sub(r'~~(.*?)~~', r'<del>\1</del>', text)
+    text = re.sub(r'\[(.*?)\]\((.*?)\)', r'<a href="\2" target="_blank">\1</a>', text)
+    text = re.sub(r'!\[(.*?)\]\((.*?)\)', r'<img src="\2" alt="\1">', text)
+    text = re.sub(r'^\s*>\s?(.*)', r'<blockquote>\1</blockquote>', text, flags=re.MULTILINE)
+    text = re.sub(r'^(#{1,6})\s*(.*)', r'<strong>\2</strong>', text, flags=re.MULTILINE)
+    text = html.escape(text, quote=False)
+    text = text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
+    return text.replace('\n', '<br>')
+
+SAMPLE_ROW = [
+    ' Item 42',
+    ' **Active**',
+    ' 1,234.56',
+    ' See [docs](https://example.com/docs) for `details`',
+    ' First line<br>Second line with ~~old~~ text',
+    '',
+]
+
+def bench(render, cells, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for cell in cells:
+            render(cell)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    cells = SAMPLE_ROW * rows
+
+    legacy = bench(legacy_process_cell_content, cells, 3)
+    current = bench(process_cell_content, cells, 3)
+
+    print(f"Cells: {len(cells):,} ({rows:,} rows x {len(SAMPLE_ROW)} columns)")
+    for name, seconds in (("regex cascade", legacy), ("single pass", current)):
+        print(f"{name:>14}: {seconds * 1e9 / len(cells):8.0f} ns/cell  "
+              f"{seconds * 1e3:8.1f} ms/table")
+    print(f"       speedup: {legacy / current:.2f}x")
+
+if __name__ == "__main__":
+    main()
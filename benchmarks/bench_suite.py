@@ -0,0 +1,253 @@
+"""Benchmark the converter on synthetic tables and check for regressions.
+
+Each case generates a table of a given shape and size, then times the
+conversion stages separately:
+
+    parse     parse_md_row over every table line
+    render    process_cell_content over every cell
+    assemble  the complete page, built in memory
+    write     writing the assembled page to disk
+
+and measures the peak memory of a full conversion: streamed from lines in
+memory, and from a Markdown file as the command line runs it (memory-mapped
+input, raw Markdown spooled to a temporary file), plain and with
+--typed-columns (which holds the whole table in columns). Results are compared
+with benchmarks/baselines.json; a stage slower than its baseline by more
+than the threshold fails the run. Each case also times a fixed reference
+workload, and baselines are scaled by how much slower or faster that ran,
+which absorbs most differences in machine speed and load. Record the
+baselines again with --update-baselines after an intended change.
+
+Usage: python benchmarks/bench_suite.py [--quick] [--case NAME ...]
+                                        [--threshold 0.5] [--update-baselines]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from md_table_to_html import (ExportOptions, convert_markdown_table_to_html, convert_to_stream, parse_md_row,
+                              process_cell_content)
+
+BASELINES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+PLAIN_CELLS = ['Item {n}', '{n}', 'Active', '', 'Pending review', '{n}.50', 'North region', 'n/a']
+FORMATTED_CELLS = [
+    '**Item {n}**',
+    '`code-{n}`',
+    'See [docs](https://example.com/{n}) for details',
+    '*emphasis* and ~~old~~ text',
+    'First line<br>Second line',
+    '![icon](img/{n}.png) __strong__',
+    '> quoted {n}',
+    '',
+]
+NUMERIC_CELLS = ['{n}', '{n:,}', '-{n}', '{n}.75', '2024-01-{day:02}', '', 'Pending', '{n}']
+
+# name: (columns, cell pool, category row every N rows or 0)
+SHAPES = {
+    'narrow-plain': (3, PLAIN_CELLS, 0),
+    'narrow-formatted': (3, FORMATTED_CELLS, 0),
+    'wide-plain': (30, PLAIN_CELLS, 0),
+    'wide-formatted': (30, FORMATTED_CELLS, 0),
+    'categories': (6, PLAIN_CELLS, 5),
+    'numeric': (8, NUMERIC_CELLS, 50),
+}
+SIZES = {'1k': 1000, '20k': 20000}
+QUICK_SIZES = ('1k',)
+
+def generate_table(columns, rows, pool=PLAIN_CELLS, category_every=0, seed=0):
+    """Return the lines of a synthetic Markdown table with cells drawn from pool.
+
+    In the numeric pool each column keeps to one pattern, so the columns
+    come out typed as int, float or date under --typed-columns.
+    """
+    rng = random.Random(seed)
+    lines = ['| ' + ' | '.join(f'Column {index}' for index in range(columns)) + ' |',
+             '|' + '---|' * columns]
+    for n in range(rows):
+        if category_every and n % category_every == 0:
+            lines.append(f'| **Group {n // category_every}** |' + ' |' * (columns - 1))
+            continue
+        if pool is NUMERIC_CELLS:
+            cells = [pool[index % len(pool)].format(n=rng.randrange(10000), day=n % 28 + 1)
+                     for index in range(columns)]
+        else:
+            cells = [rng.choice(pool).format(n=n) for _ in range(columns)]
+        lines.append('| ' + ' | '.join(cells) + ' |')
+    return lines
+
+class _NullWriter:
+    """Binary sink that only counts bytes."""
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+
+def _best(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def _reference_workload():
+    """Fixed string splitting and joining, timed to calibrate the baselines against this machine."""
+    text = '| alpha | **beta** | gamma |'
+    for _ in range(20000):
+        ''.join(cell.strip().upper() for cell in text.split('|'))
+
+def _peak_memory(lines, name):
+    """Peak traced memory, in MB, of converting lines into a sink that keeps nothing."""
+    tracemalloc.start()
+    convert_to_stream(lines, _NullWriter(), name=f'{name}.md')
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+def _peak_file_memory(md_file, html_file, options=None):
+    """Peak traced memory, in MB, of converting md_file to html_file as the command line does."""
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        convert_markdown_table_to_html(md_file, html_file, options=options)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+def run_case(name, columns, rows, pool, category_every, repeat):
+    """Time each stage for one synthetic table and return its metrics."""
+    calibration = _best(_reference_workload, repeat)
+    lines = generate_table(columns, rows, pool, category_every)
+    markdown = '\n'.join(lines) + '\n'
+    cells = [cell for line in lines[2:] for cell in parse_md_row(line)]
+
+    parse = _best(lambda: [parse_md_row(line) for line in lines], repeat)
+    render = _best(lambda: [process_cell_content(cell) for cell in cells], repeat)
+    page = io.BytesIO()
+    assemble = _best(lambda: convert_to_stream(lines, _reset(page), name=f'{name}.md'), repeat)
+    data = page.getvalue()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'page.html')
+
+        def write():
+            with open(path, 'wb') as out:
+                out.write(data)
+        write_seconds = _best(write, repeat)
+        md_file = os.path.join(tmp, f'{name}.md')
+        with open(md_file, 'w', encoding='utf-8') as f:
+            f.write(markdown)
+        file_peak = _peak_file_memory(md_file, path)
+        typed_peak = _peak_file_memory(md_file, path, ExportOptions(typed_columns=True))
+
+    return {
+        'calibration_s': calibration,
+        'rows': rows,
+        'columns': columns,
+        'input_bytes': len(markdown.encode('utf-8')),
+        'output_bytes': len(data),
+        'parse_s': parse,
+        'render_s': render,
+        'assemble_s': assemble,
+        'write_s': write_seconds,
+        'rows_per_s': rows / assemble,
+        'mb_per_s': len(markdown.encode('utf-8')) / (1024 * 1024) / assemble,
+        'peak_mb': _peak_memory(lines, name),
+        'file_peak_mb': file_peak,
+        'typed_peak_mb': typed_peak,
+    }
+
+def _reset(buffer):
+    buffer.seek(0)
+    buffer.truncate()
+    return buffer
+
+STAGES = ('parse_s', 'render_s', 'assemble_s', 'write_s')
+# Differences under 5 ms are noise on short stages and never count as regressions
+NOISE_FLOOR = 0.005
+
+def compare(name, result, baseline, threshold):
+    """Return the regressions of result against baseline, as messages."""
+    regressions = []
+    scale = result['calibration_s'] / baseline['calibration_s'] if baseline.get('calibration_s') else 1.0
+    for stage in STAGES:
+        old, new = baseline.get(stage), result[stage]
+        if old is None:
+            continue
+        old *= scale
+        if new - old < NOISE_FLOOR:
+            continue
+        if new > old * (1 + threshold):
+            regressions.append(f"{name}: {stage[:-2]} {new * 1e3:.1f} ms vs scaled baseline {old * 1e3:.1f} ms "
+                               f"(+{(new / old - 1) * 100:.0f}%)")
+    for metric, label in (('peak_mb', 'peak memory'), ('file_peak_mb', 'file peak memory'),
+                          ('typed_peak_mb', 'typed peak memory')):
+        old_peak = baseline.get(metric)
+        if old_peak and result[metric] > old_peak * (1 + threshold) + 1:
+            regressions.append(f"{name}: {label} {result[metric]:.1f} MB vs baseline {old_peak:.1f} MB")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the converter on synthetic tables.")
+    parser.add_argument('--quick', action='store_true', help="only the small sizes")
+    parser.add_argument('--case', action='append', metavar='NAME',
+                        help="run only this case, e.g. wide-formatted-20k (repeatable)")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per stage; the best is kept")
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help="allowed slowdown against the baseline (default: 0.5 = 50%%)")
+    parser.add_argument('--update-baselines', action='store_true',
+                        help=f"store these results as the baselines in {os.path.basename(BASELINES_FILE)}")
+    args = parser.parse_args(argv)
+
+    baselines = {}
+    if os.path.exists(BASELINES_FILE):
+        with open(BASELINES_FILE, 'r', encoding='utf-8') as f:
+            baselines = json.load(f)
+
+    sizes = QUICK_SIZES if args.quick else SIZES
+    results = {}
+    regressions = []
+    print(f"{'case':<22} {'parse':>9} {'render':>9} {'assemble':>9} {'write':>9} "
+          f"{'rows/s':>10} {'MB/s':>7} {'peak MB':>8} {'file MB':>8} {'typed MB':>8}")
+    for shape, (columns, pool, category_every) in SHAPES.items():
+        for size in sizes:
+            name = f'{shape}-{size}'
+            if args.case and name not in args.case:
+                continue
+            result = run_case(name, columns, SIZES[size], pool, category_every, args.repeat)
+            results[name] = result
+            print(f"{name:<22} " + ' '.join(f"{result[stage] * 1e3:7.1f}ms" for stage in STAGES)
+                  + f" {result['rows_per_s']:10,.0f} {result['mb_per_s']:7.1f} {result['peak_mb']:8.1f}"
+                  f" {result['file_peak_mb']:8.1f} {result['typed_peak_mb']:8.1f}")
+            if name in baselines and not args.update_baselines:
+                regressions.extend(compare(name, result, baselines[name], args.threshold))
+
+    if args.update_baselines:
+        baselines.update(results)
+        with open(BASELINES_FILE, 'w', encoding='utf-8') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baselines updated: {BASELINES_FILE}")
+        return 0
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) past the {args.threshold:.0%} threshold:")
+        for message in regressions:
+            print(f"  {message}")
+        return 1
+    print("\nNo regressions." if baselines else "\nNo baselines yet; record them with --update-baselines.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,8 @@ import ctypes
 import sys
 import threading
 import time
-from md_table_to_html import convert_markdown_table_to_html
+import uuid
+from md_table_to_html import convert_markdown_table_to_html, count_file_lines, iter_mapped_tables
 
 # Enable DPI awareness for Windows
 try:
@@ -24,12 +25,123 @@ else:
 HTML_FILE = BASE_DIR / "templates" / "index.html"
 STATIC_DIR = BASE_DIR / "static"
 
+# Files whose analysis is kept; each holds its first table's lines
+ANALYSIS_CACHE_SIZE = 2
+
+class FileAnalysis:
+    """What the GUI needs to know about a Markdown file, from a scan of its mapped bytes"""
+
+    def __init__(self, file_path, stat):
+        self.key = (str(file_path), stat.st_mtime_ns, stat.st_size)
+        self.stat = stat
+        self.total_lines = count_file_lines(file_path)
+        self.pipe_lines = 0
+        # Lines of the first table, as the converter reads them
+        self.table_lines = []
+        first_pipe_lines = []
+
+        # Only the tables are decoded; the rest of the file is scanned as bytes
+        for table in iter_mapped_tables(file_path):
+            self.pipe_lines += table.end_line - table.start_line + 1
+            if table.index == 0:
+                self.table_lines = list(table.lines)
+                first_pipe_lines = self.table_lines[:2]
+            elif len(first_pipe_lines) < 2:
+                first_pipe_lines.append(next(table.lines))
+
+        # Check for table presence
+        if self.pipe_lines < 2:
+            self.is_valid, self.message = False, "No valid markdown table found in file"
+        # Basic table structure validation
+        elif not any('|' in line and line.count('|') >= 2 for line in first_pipe_lines):
+            self.is_valid, self.message = False, "Invalid table structure"
+        else:
+            self.is_valid, self.message = True, "Valid markdown table found"
+
+    @property
+    def table_rows(self):
+        """Body rows of the first table, excluding header and separator"""
+        return max(len(self.table_lines) - 2, 0)
+
+class ConversionCancelled(Exception):
+    """Raised from a job's progress callback to stop its conversion"""
+
+class ConversionJob:
+    """A conversion running on a background thread, polled from the UI"""
+
+    def __init__(self, input_path, output_file, analysis):
+        self.id = uuid.uuid4().hex
+        self.input_path = input_path
+        self.output_file = output_file
+        self.analysis = analysis
+        self.status = "running"
+        self.message = "Converting your table..."
+        self.rows_done = 0
+        self.total_rows = analysis.table_rows
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f"conversion-{self.id}", daemon=True)
+
+    def progress(self, rows_done):
+        """Record progress; called by the converter from the worker thread"""
+        if self.cancel_event.is_set():
+            raise ConversionCancelled()
+        self.rows_done = rows_done
+
+    def run(self):
+        """Convert into a temporary file and move it into place on success"""
+        temp_file = self.output_file.with_name(f".{self.output_file.name}.{self.id}.tmp")
+        try:
+            # The table's lines were read when the file was analysed
+            if not convert_markdown_table_to_html(self.input_path, temp_file, progress=self.progress,
+                                                  lines=self.analysis.table_lines):
+                raise ValueError("No valid markdown table found in file")
+            os.replace(temp_file, self.output_file)
+
+            # Open the converted file
+            webbrowser.open(f"file://{self.output_file.resolve()}")
+            self.message = f"Successfully exported: {self.output_file.name}"
+            self.status = "success"
+        except ConversionCancelled:
+            self.message = "Conversion cancelled"
+            self.status = "cancelled"
+        except Exception as e:
+            print(f"Conversion error: {e}")
+            self.message = f"Conversion failed: {str(e)}"
+            self.status = "error"
+        finally:
+            if temp_file.exists():
+                temp_file.unlink()
+
+    def to_json(self):
+        """Describe the job's state for the UI"""
+        state = {
+            "status": self.status,
+            "job_id": self.id,
+            "message": self.message,
+            "rows_done": self.rows_done,
+            "total_rows": self.total_rows
+        }
+        if self.status == "success":
+            state["filePath"] = str(self.output_file.resolve())
+            state["fileName"] = self.output_file.name
+        return json.dumps(state)
+
 class Api:
     def __init__(self, window):
         self.window = window
         self.input_path = ""
         self.output_path = ""
-        self.conversion_in_progress = False
+        self.jobs = {}
+        self.current_job = None
+        self.jobs_lock = threading.Lock()
+        self.analyses = {}
+        self.analysis_lock = threading.Lock()
+
+    @property
+    def conversion_in_progress(self):
+        """True while the current conversion job is running"""
+        job = self.current_job
+        return job is not None and job.status == "running"
 
     def minimize_app(self):
         """Minimize the application window"""
@@ -53,30 +165,32 @@ class Api:
             "description": "Modern Markdown Table to HTML Converter"
         })
 
+    def analyze_file(self, file_path):
+        """Get the file's analysis, reading it only if it changed since the last call"""
+        file_path = str(file_path)
+        stat = os.stat(file_path)
+        with self.analysis_lock:
+            analysis = self.analyses.get(file_path)
+            if analysis is None or analysis.key != (file_path, stat.st_mtime_ns, stat.st_size):
+                analysis = FileAnalysis(file_path, stat)
+                # Most recently analysed files are kept
+                self.analyses.pop(file_path, None)
+                self.analyses[file_path] = analysis
+                while len(self.analyses) > ANALYSIS_CACHE_SIZE:
+                    del self.analyses[next(iter(self.analyses))]
+            return analysis
+
     def validate_markdown_file(self, file_path):
         """Validate if the markdown file contains a valid table"""
         try:
             if not file_path or not Path(file_path).exists():
                 return False, "File does not exist"
             
-            if not file_path.lower().endswith('.md'):
+            if not str(file_path).lower().endswith('.md'):
                 return False, "File must be a .md (Markdown) file"
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Check for table presence
-            lines = content.splitlines()
-            table_lines = [line for line in lines if line.strip().startswith('|')]
-            
-            if len(table_lines) < 2:
-                return False, "No valid markdown table found in file"
-            
-            # Basic table structure validation
-            if not any('|' in line and line.count('|') >= 2 for line in table_lines[:2]):
-                return False, "Invalid table structure"
-            
-            return True, "Valid markdown table found"
+            analysis = self.analyze_file(file_path)
+            return analysis.is_valid, analysis.message
             
         except Exception as e:
             return False, f"Error reading file: {str(e)}"
@@ -87,21 +201,16 @@ class Api:
             if not file_path or not Path(file_path).exists():
                 return json.dumps({"error": "File not found"})
             
+            analysis = self.analyze_file(file_path)
             file_path = Path(file_path)
-            stat = file_path.stat()
-            
-            # Count lines and table rows
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            table_lines = [line for line in lines if line.strip().startswith('|')]
+            stat = analysis.stat
             
             info = {
                 "name": file_path.name,
                 "size": stat.st_size,
                 "size_formatted": self._format_file_size(stat.st_size),
-                "total_lines": len(lines),
-                "table_rows": len(table_lines) - 2 if len(table_lines) >= 2 else 0,  # Exclude header and separator
+                "total_lines": analysis.total_lines,
+                "table_rows": analysis.pipe_lines - 2 if analysis.pipe_lines >= 2 else 0,  # Exclude header and separator
                 "modified": time.ctime(stat.st_mtime),
                 "path": str(file_path.parent)
             }
@@ -209,14 +318,11 @@ class Api:
                 "message": f"Failed to select folder: {str(e)}"
             })
 
-    def convert_table(self):
-        """Convert markdown table to HTML with progress tracking"""
-        if self.conversion_in_progress:
-            return json.dumps({
-                "status": "error", 
-                "message": "Conversion already in progress"
-            })
-        
+    def start_conversion(self):
+        """Start converting the selected file on a background thread.
+
+        Returns the new job's state; follow it with poll_conversion(job_id).
+        """
         try:
             if not self.input_path:
                 return json.dumps({
@@ -224,13 +330,15 @@ class Api:
                     "message": "Please select a source file first"
                 })
             
-            # Validate file again before conversion
+            # Validate file again before conversion; unless the file changed,
+            # this reuses the analysis made when it was selected
             is_valid, validation_message = self.validate_markdown_file(self.input_path)
             if not is_valid:
                 return json.dumps({
                     "status": "error", 
                     "message": validation_message
                 })
+            analysis = self.analyze_file(self.input_path)
             
             input_path = Path(self.input_path)
             
@@ -241,33 +349,55 @@ class Api:
                 output_dir = input_path.parent
             
             output_file = output_dir / f"{input_path.stem}.html"
-            
+
+            # Checking and claiming the current job happen under one lock,
+            # so a second click cannot start a parallel conversion
+            with self.jobs_lock:
+                if self.conversion_in_progress:
+                    return json.dumps({
+                        "status": "error",
+                        "message": "Conversion already in progress"
+                    })
+                job = ConversionJob(input_path, output_file, analysis)
+                self.jobs[job.id] = job
+                self.current_job = job
+
             print(f"Converting: {input_path} -> {output_file}")
-            
-            # Set conversion flag
-            self.conversion_in_progress = True
-            
-            # Perform conversion
-            convert_markdown_table_to_html(input_path, output_file)
-            
-            # Open the converted file
-            webbrowser.open(f"file://{output_file.resolve()}")
-            
-            return json.dumps({
-                "status": "success", 
-                "message": f"Successfully exported: {output_file.name}",
-                "filePath": str(output_file.resolve()),
-                "fileName": output_file.name
-            })
-            
+            job.thread.start()
+            return job.to_json()
+
         except Exception as e:
             print(f"Conversion error: {e}")
             return json.dumps({
                 "status": "error", 
                 "message": f"Conversion failed: {str(e)}"
             })
-        finally:
-            self.conversion_in_progress = False
+
+    def poll_conversion(self, job_id):
+        """Get a conversion job's status and progress"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return json.dumps({"status": "error", "message": "Unknown conversion job"})
+        # Finished jobs are reported once, then forgotten
+        if job.status != "running":
+            self.jobs.pop(job_id, None)
+        return job.to_json()
+
+    def cancel_conversion(self, job_id):
+        """Ask a running conversion job to stop"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return json.dumps({"status": "error", "message": "Unknown conversion job"})
+        job.cancel_event.set()
+        return json.dumps({"status": "success", "message": "Cancelling conversion..."})
+
+    def convert_table(self):
+        """Convert markdown table to HTML, waiting for the job to finish"""
+        started = json.loads(self.start_conversion())
+        if started["status"] != "running":
+            return json.dumps(started)
+        self.jobs[started["job_id"]].thread.join()
+        return self.poll_conversion(started["job_id"])
 
     def get_conversion_status(self):
         """Get current conversion status"""
@@ -307,6 +437,9 @@ def start_gui():
             api.select_input_file,
             api.select_output_folder,
             api.convert_table,
+            api.start_conversion,
+            api.poll_conversion,
+            api.cancel_conversion,
             api.set_input_path,
             api.get_file_info,
             api.validate_markdown_file,
@@ -0,0 +1,261 @@
+"""Asynchronous HTTP service for converting Markdown tables.
+
+POST Markdown to /page for the full viewer page, or to /fragment for the
+table markup only. Query parameters choose the export options:
+
+    name=report.md  tables=all  typed_columns=1  virtual=1  search_index=1  offline=1
+
+Rendering runs in a process pool. Requests beyond the queue limit are
+turned away with 503 before their body is read, instead of piling up. A
+worker builds the whole response; it is then sent in chunks, waiting for
+the client to read each one.
+
+    python md_table_server.py --port 8080
+    curl --data-binary @report.md 'http://127.0.0.1:8080/page?name=report.md'
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from md_table_to_html import ExportOptions, convert_to_string
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+# Requests accepted at once (rendering or waiting for a worker)
+DEFAULT_QUEUE_SIZE = 32
+MAX_BODY_SIZE = 64 * 1024 * 1024
+RESPONSE_CHUNK_SIZE = 64 * 1024
+# Seconds an idle keep-alive connection is held open
+KEEPALIVE_TIMEOUT = 15
+
+_ROUTES = {'/page': True, '/fragment': False}
+_FLAGS = ('typed_columns', 'virtual', 'search_index', 'offline')
+
+class HttpError(Exception):
+    """An error response, sent as JSON."""
+
+    def __init__(self, status, code, message):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+def _render(markdown, name, option_args, page):
+    """Process pool worker: convert one request body.
+
+    Returns (ok, body bytes or error code, error message, rows).
+    """
+    result = convert_to_string(markdown, name, options=ExportOptions(**option_args), page=page)
+    if not result.ok:
+        return False, result.error.code, str(result.error), 0
+    return True, result.html.encode('utf-8'), '', result.rows
+
+def _parse_options(query):
+    """Read the export options from a request's query string."""
+    params = parse_qs(query)
+    tables = params.get('tables', [None])[-1]
+    if tables not in (None, 'all'):
+        raise HttpError(HTTPStatus.BAD_REQUEST, 'bad_option', "tables must be 'all' or omitted")
+    option_args = {'tables': tables}
+    for flag in _FLAGS:
+        option_args[flag] = params.get(flag, ['0'])[-1].lower() in ('1', 'true', 'yes')
+    name = params.get('name', ['table.md'])[-1]
+    return name, option_args
+
+def _pool_context():
+    """Start workers from a clean process: a worker forked from the server
+    would inherit its open client sockets and keep them from closing."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+class ConversionServer:
+    """Serve conversions on an asyncio loop, rendering in a process pool."""
+
+    def __init__(self, jobs=None, queue_size=DEFAULT_QUEUE_SIZE, log=sys.stderr):
+        self.jobs = jobs
+        self.executor = ProcessPoolExecutor(max_workers=jobs, mp_context=_pool_context())
+        self.queue_size = queue_size
+        self.pending = 0
+        self.log = log
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Start listening; port 0 picks a free port. Returns the asyncio.Server."""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection until it closes or asks to."""
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                except ValueError:
+                    request_line = None  # Longer than the reader's line limit
+                if request_line is not None and not request_line.strip():
+                    break
+                keep_alive = await self.handle_request(request_line, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, request_line, reader, writer):
+        """Serve one request; return whether the connection stays open."""
+        start = time.perf_counter()
+        queued = rendered = start
+        method = path = '-'
+        keep_alive = False
+        try:
+            if request_line is None:
+                raise HttpError(HTTPStatus.BAD_REQUEST, 'bad_request', "Request line too long")
+            try:
+                method, target, version = request_line.decode('latin-1').split()
+            except ValueError:
+                raise HttpError(HTTPStatus.BAD_REQUEST, 'bad_request', "Malformed request line")
+            headers = await self._read_headers(reader)
+            connection = headers.get('connection', '').lower()
+            keep_alive = connection == 'keep-alive' or (version == 'HTTP/1.1' and connection != 'close')
+            url = urlsplit(target)
+            path = url.path
+
+            if path not in _ROUTES:
+                raise HttpError(HTTPStatus.NOT_FOUND, 'not_found', f"No route {path}; POST to /page or /fragment")
+            if method != 'POST':
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, 'method_not_allowed', "Use POST")
+            name, option_args = _parse_options(url.query)
+
+            # Backpressure: refuse work beyond the queue before reading its
+            # body, so at most queue_size bodies are held at once
+            if self.pending >= self.queue_size:
+                raise HttpError(HTTPStatus.SERVICE_UNAVAILABLE, 'busy', "Server busy, retry shortly")
+            self.pending += 1
+            try:
+                body = await self._read_body(reader, headers)
+                try:
+                    markdown = body.decode('utf-8')
+                except UnicodeDecodeError:
+                    raise HttpError(HTTPStatus.BAD_REQUEST, 'bad_encoding', "Request body must be UTF-8")
+                queued = time.perf_counter()
+                loop = asyncio.get_running_loop()
+                try:
+                    ok, payload, message, rows = await loop.run_in_executor(
+                        self.executor, _render, markdown, name, option_args, _ROUTES[path])
+                except BrokenProcessPool:
+                    # A worker died; later requests get a fresh pool
+                    self.executor.shutdown(wait=False)
+                    self.executor = ProcessPoolExecutor(max_workers=self.jobs, mp_context=_pool_context())
+                    raise HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, 'worker_failed',
+                                    "The conversion worker stopped unexpectedly")
+                except Exception as e:
+                    raise HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, 'internal_error',
+                                    f"Conversion failed: {e}")
+                rendered = time.perf_counter()
+            finally:
+                self.pending -= 1
+            if not ok:
+                raise HttpError(HTTPStatus.UNPROCESSABLE_ENTITY, payload, message)
+
+            timing = (f'read;dur={(queued - start) * 1000:.1f}, '
+                      f'render;dur={(rendered - queued) * 1000:.1f}')
+            await self._send(writer, HTTPStatus.OK, 'text/html; charset=utf-8', payload, keep_alive,
+                             {'Server-Timing': timing, 'X-Table-Rows': str(rows)})
+            status = HTTPStatus.OK
+        except HttpError as e:
+            payload = json.dumps({'error': e.code, 'message': str(e)}).encode('utf-8')
+            extra = {'Retry-After': '1'} if e.status == HTTPStatus.SERVICE_UNAVAILABLE else {}
+            # The unread body of a refused request would be taken for the next request
+            keep_alive = keep_alive and e.status not in (HTTPStatus.BAD_REQUEST, HTTPStatus.NOT_FOUND,
+                                                         HTTPStatus.METHOD_NOT_ALLOWED,
+                                                         HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                                         HTTPStatus.LENGTH_REQUIRED,
+                                                         HTTPStatus.SERVICE_UNAVAILABLE)
+            await self._send(writer, e.status, 'application/json', payload, keep_alive, extra)
+            status = e.status
+
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{method} {path} {status.value} {len(payload)} bytes {elapsed:.1f} ms "
+              f"(render {(rendered - queued) * 1000:.1f} ms)", file=self.log)
+        return keep_alive
+
+    async def _read_headers(self, reader):
+        headers = {}
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                raise HttpError(HTTPStatus.BAD_REQUEST, 'bad_request', "Header line too long")
+            if line in (b'\r\n', b'\n', b''):
+                return headers
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+    async def _read_body(self, reader, headers):
+        if 'content-length' not in headers:
+            raise HttpError(HTTPStatus.LENGTH_REQUIRED, 'length_required', "Content-Length is required")
+        try:
+            length = int(headers['content-length'])
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, 'bad_request', "Invalid Content-Length")
+        if length < 0:
+            raise HttpError(HTTPStatus.BAD_REQUEST, 'bad_request', "Invalid Content-Length")
+        if length > MAX_BODY_SIZE:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'too_large',
+                            f"Request body over {MAX_BODY_SIZE} bytes")
+        return await reader.readexactly(length)
+
+    async def _send(self, writer, status, content_type, payload, keep_alive, extra_headers):
+        """Send a response held in memory, writing the body in chunks as the client reads it."""
+        head = [f'HTTP/1.1 {status.value} {status.phrase}',
+                f'Content-Type: {content_type}',
+                f'Content-Length: {len(payload)}',
+                f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        head.extend(f'{name}: {value}' for name, value in extra_headers.items())
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+        view = memoryview(payload)
+        for offset in range(0, len(view), RESPONSE_CHUNK_SIZE):
+            writer.write(view[offset:offset + RESPONSE_CHUNK_SIZE])
+            await writer.drain()
+        await writer.drain()
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, jobs=None, queue_size=DEFAULT_QUEUE_SIZE):
+    """Run the conversion service until cancelled."""
+    server = ConversionServer(jobs, queue_size)
+    try:
+        listener = await server.start(host, port)
+        for sock in listener.sockets:
+            print(f"Serving conversions on http://{sock.getsockname()[0]}:{sock.getsockname()[1]}")
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Markdown table conversions over HTTP.")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="render worker processes (default: one per CPU)")
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                        help="requests accepted at once before answering 503 "
+                             f"(default: {DEFAULT_QUEUE_SIZE})")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.jobs, args.queue_size))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
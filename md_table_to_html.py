@@ -1,133 +1,1937 @@
 import re
-import html
+import base64
+import codecs
+import copy
+import gzip
 import sys
+import html
+import math
+import mmap
+import operator
 import os
+import io
+import glob
+import json
+import hashlib
+import time
+import argparse
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from collections import defaultdict, deque, namedtuple
+from contextlib import closing, contextmanager, nullcontext, redirect_stdout
+from decimal import Decimal
+from functools import lru_cache, partial
+from itertools import chain, compress, islice, repeat
+from string import Formatter
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from urllib.parse import quote
+
+try:
+    import brotli  # Optional: .br output
+except ImportError:
+    brotli = None
+
+# Bump when the output format changes; cached outputs from older versions are rebuilt
+CONVERTER_VERSION = '2.1.0'
+CACHE_MANIFEST_NAME = '.md_table_cache.json'
+
+# Default number of distinct cells kept by cached_cell_renderer()
+CELL_CACHE_SIZE = 4096
+
+# Tables larger than this are spooled to disk while the page is written
+SPOOL_MAX_SIZE = 4 * 1024 * 1024
+
+# Inline Markdown is rendered in a single scan per line: one compiled
+# alternation finds the next construct, and the text between matches is
+# copied through unchanged. Nested constructs (e.g. a link inside bold) are
+# rendered by recursing into the captured inner text.
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_INLINE_RE = re.compile(
+    r'!\[(?P<img_alt>.*?)\]\((?P<img_src>.*?)\)'   # Images ![alt](url)
+    r'|\[(?P<link_text>.*?)\]\((?P<link_href>.*?)\)'  # Links [text](url)
+    r'|\*\*(?P<strong>.*?)\*\*'                   # Bold **text**
+    r'|__(?P<strong_u>.*?)__'                      # Bold __text__
+    # Italic *text* and _text_, stepping over bold inside them: a closing
+    # delimiter that opens a complete **bold** or __bold__ span is not one
+    r'|\*(?!\*)(?P<em>(?:\*\*.*?\*\*|.)*?)\*(?!\*.*?\*\*)'
+    r'|_(?P<em_u>(?:__.*?__|.)*?)_(?!_.*?__)'
+    r'|`(?P<code>.*?)`'                            # Inline code `text`
+    r'|~~(?P<del>.*?)~~'                           # Strikethrough ~~text~~
+)
+_BLOCKQUOTE_RE = re.compile(r'\s*>\s?')
+_HEADING_RE = re.compile(r'#{1,6}\s*')
+# Cells without any of these characters need no processing at all
+_MARKUP_CHARS_RE = re.compile(r'[*_`~\[<>#]')
+
+_INLINE_TAGS = {
+    'strong': 'strong',
+    'strong_u': 'strong',
+    'em': 'em',
+    'em_u': 'em',
+    'code': 'code',
+    'del': 'del',
+}
+
+def _render_inline_match(match):
+    """Render one inline construct found by _INLINE_RE."""
+    kind = match.lastgroup
+    if kind == 'img_src':
+        return f'<img src="{match.group("img_src")}" alt="{match.group("img_alt")}">'
+    if kind == 'link_href':
+        text = _render_inline(match.group('link_text'))
+        return f'<a href="{match.group("link_href")}" target="_blank">{text}</a>'
+    tag = _INLINE_TAGS[kind]
+    return f'<{tag}>{_render_inline(match.group(kind))}</{tag}>'
+
+def _render_inline(text):
+    """Render inline Markdown within a single line of cell text."""
+    return _INLINE_RE.sub(_render_inline_match, text)
+
+def _render_cell_line(line):
+    """Render one line of a cell, including line-level blockquotes and headings."""
+    quote = _BLOCKQUOTE_RE.match(line)
+    if quote:
+        return f'<blockquote>{_render_inline(line[quote.end():])}</blockquote>'
+    heading = _HEADING_RE.match(line)
+    if heading:
+        return f'<strong>{_render_inline(line[heading.end():])}</strong>'
+    return _render_inline(line)
 
 def process_cell_content(text):
     """Process cell content to handle <br> tags, expanded Markdown syntax, and preserve new lines."""
-    # Replace <br> with actual line breaks for processing
-    text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-
-    # Bold (**text** or __text__)
-    text = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', text)
-    text = re.sub(r'__(.*?)__', r'<strong>\1</strong>', text)
-
-    # Italic (*text* or _text_)
-    text = re.sub(r'(?<!\*)\*(?!\*)(.*?)\*(?<!\*)', r'<em>\1</em>', text)  # Avoid bold markers
-    text = re.sub(r'_(.*?)_', r'<em>\1</em>', text)
-
-    # Inline code (`text`)
-    text = re.sub(r'`(.*?)`', r'<code>\1</code>', text)
-
-    # Strikethrough (~~text~~)
-    text = re.sub(r'~~(.*?)~~', r'<del>\1</del>', text)
-
-    # Links [text](url)
-    text = re.sub(r'\[(.*?)\]\((.*?)\)', r'<a href="\2" target="_blank">\1</a>', text)
-
-    # Images ![alt](url)
-    text = re.sub(r'!\[(.*?)\]\((.*?)\)', r'<img src="\2" alt="\1">', text)
-
-    # Blockquotes > text (we can wrap in <blockquote>)
-    text = re.sub(r'^\s*>\s?(.*)', r'<blockquote>\1</blockquote>', text, flags=re.MULTILINE)
-
-    # Headings (### Heading → <strong>Heading</strong> inside tables)
-    text = re.sub(r'^(#{1,6})\s*(.*)', r'<strong>\2</strong>', text, flags=re.MULTILINE)
-
-    # Escape other HTML entities but keep our injected tags
-    text = html.escape(text, quote=False)
-    text = text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-
-    # Convert line breaks back to <br>
-    return text.replace('\n', '<br>')
-
-def convert_markdown_table_to_html(md_file, html_file):
-    try:
-        with open(md_file, 'r', encoding='utf-8') as f:
-            lines = f.read().splitlines()
-    except FileNotFoundError:
-        print(f"Error: File '{md_file}' not found.")
-        return
-
-    # Extract Markdown table lines
-    table_lines = []
+    if not _MARKUP_CHARS_RE.search(text):
+        return text
+
+    # <br> separates lines; inline markup never spans a line break
+    if '<' in text:
+        lines = _BR_RE.split(text)
+        if len(lines) > 1:
+            return '<br>'.join([_render_cell_line(line) for line in lines])
+
+    # Raw HTML in cells is passed through unchanged
+    return _render_cell_line(text)
+
+def parse_md_row(line):
+    """Split a Markdown table line into its cell texts."""
+    return [cell.rstrip() for cell in line.strip().strip('|').split('|')]
+
+def iter_file_lines(md_file):
+    """Yield the lines of a file one at a time, without line endings."""
+    with open(md_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            yield line.rstrip('\n')
+
+def iter_table_lines(lines):
+    """Yield the lines of the first Markdown table found in lines."""
     in_table = False
     for line in lines:
         if line.strip().startswith('|'):
             in_table = True
-            table_lines.append(line)
+            yield line
         elif in_table:
             break  # Stop after first non-table line
 
-    if not table_lines:
-        print("Error: No table found in the Markdown file.")
-        return
-
-    def parse_md_row(line):
-        return [cell.rstrip() for cell in line.strip().strip('|').split('|')]
+def cached_cell_renderer(maxsize=CELL_CACHE_SIZE):
+    """Return process_cell_content behind a bounded LRU memo.
+
+    Repeated cell text (status columns, Yes/No, empty cells) then costs a
+    single lookup. Hit and miss counts are available from the returned
+    function's cache_info().
+    """
+    return lru_cache(maxsize=maxsize)(process_cell_content)
+
+def _is_category_row(row):
+    """A category row has text in its first column only."""
+    return bool(row[0].strip()) and all(cell.strip() == '' for cell in row[1:])
+
+def fit_row(row, col_count):
+    """Pad or cut the cell list row to col_count cells, in place, and return it."""
+    missing = col_count - len(row)
+    if missing > 0:
+        row.extend(repeat('', missing))
+    elif missing:
+        del row[col_count:]
+    return row
+
+def render_table_rows(rows, col_count, render_cell=process_cell_content, is_category_row=_is_category_row):
+    """Yield one HTML <tr> fragment per parsed content row."""
+    for row in rows:
+        if len(row) != col_count:
+            fit_row(row, col_count)
+        # Detect category row: only first column has text
+        if is_category_row(row):
+            processed_category = render_cell(row[0])
+            yield f'<tr class="category-row"><td colspan="{col_count}">{processed_category}</td></tr>'
+            continue
 
-    raw_rows = [parse_md_row(line) for line in table_lines]
-    if len(raw_rows) < 2:
-        print("Error: Table must have at least header and separator.")
+        # This is a data row
+        yield '<tr>' + ''.join([f'<td>{render_cell(cell)}</td>' for cell in row]) + '</tr>'
+
+# Body lines sent to a render worker at a time by render_rows_parallel()
+PARALLEL_CHUNK_ROWS = 4096
+
+_worker_render_cell = process_cell_content
+
+def _init_render_worker(render_cell, cell_cache):
+    """Process pool initializer: set up a render worker's cell renderer."""
+    global _worker_render_cell
+    _worker_render_cell = cached_cell_renderer(cell_cache) if cell_cache else render_cell
+
+def _render_chunk(lines, col_count):
+    """Process pool worker: parse and render one chunk of body lines."""
+    return list(render_table_rows(map(parse_md_row, lines), col_count, _worker_render_cell))
+
+def render_rows_parallel(lines, col_count, render_cell=process_cell_content, jobs=None):
+    """Yield render_table_rows() fragments for a table's body lines, rendered in a process pool.
+
+    The lines go to the workers PARALLEL_CHUNK_ROWS at a time and the
+    fragments come back in order, with at most two chunks per worker in
+    flight. A category row is decided from its own cells alone, so chunk
+    boundaries cannot change it. A table shorter than one chunk is rendered
+    here without starting the pool. render_cell must be picklable; a
+    cached_cell_renderer() is recreated, with its size, in each worker.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    lines = iter(lines)
+    chunk = list(islice(lines, PARALLEL_CHUNK_ROWS))
+    if jobs == 1 or len(chunk) < PARALLEL_CHUNK_ROWS:
+        yield from render_table_rows(map(parse_md_row, chain(chunk, lines)), col_count, render_cell)
         return
 
-    header = raw_rows[0]
-    separator = raw_rows[1]
-    content_rows = raw_rows[2:]
-
+    cache_info = getattr(render_cell, 'cache_info', None)
+    cell_cache = cache_info().maxsize if cache_info else 0
+    executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_render_worker,
+                                   initargs=(None if cell_cache else render_cell, cell_cache))
+    pending = deque()
+    try:
+        while chunk:
+            pending.append(executor.submit(_render_chunk, chunk, col_count))
+            if len(pending) >= jobs * 2:
+                yield from pending.popleft().result()
+            chunk = list(islice(lines, PARALLEL_CHUNK_ROWS))
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        # Drop the chunks not yet started when the caller stops early
+        for future in pending:
+            future.cancel()
+        executor.shutdown()
+
+def _tee_lines(lines, spool):
+    """Yield lines unchanged while appending each one, encoded, to spool."""
+    for line in lines:
+        spool.write(b'\n')
+        spool.write(line.encode('utf-8'))
+        yield line
+
+@lru_cache(maxsize=None)
+def _page_segments():
+    """Split _PAGE_TEMPLATE into (static bytes, field name) pairs, once per process."""
+    segments = []
+    literal = []
+    for text, field, _, _ in Formatter().parse(_PAGE_TEMPLATE):
+        literal.append(text)
+        if field is not None:
+            segments.append((''.join(literal).encode('utf-8'), field))
+            literal = []
+    segments.append((''.join(literal).encode('utf-8'), None))
+    return tuple(segments)
+
+def _write_page(out, fields):
+    """Write the page to a binary stream.
+
+    Each field is either bytes or a callable that writes its own content to out.
+    """
+    for literal, field in _page_segments():
+        out.write(literal)
+        if field is None:
+            continue
+        value = fields[field]
+        if callable(value):
+            value(out)
+        else:
+            out.write(value)
+
+# Pages load their icons and the PDF libraries from these CDNs unless exported offline.
+# The PDF libraries are only fetched when the export menu is first opened.
+_CDN_ICON_ASSETS = b'<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">'
+_CDN_PDF_LIBRARIES = ('https://cdnjs.cloudflare.com/ajax/libs/jspdf/2.5.1/jspdf.umd.min.js',
+                      'https://cdnjs.cloudflare.com/ajax/libs/jspdf-autotable/3.5.28/jspdf.plugin.autotable.min.js')
+
+# Offline pages embed jsPDF from these files when they are present
+VENDOR_DIR = Path(__file__).resolve().parent / 'vendor'
+PDF_LIBRARIES = ('jspdf.umd.min.js', 'jspdf.plugin.autotable.min.js')
+
+# Stand-ins for the Font Awesome icons the viewer uses, as 24x24 SVG paths
+# drawn with a 2px round stroke (or filled, for a leading 'F')
+_ICON_PATHS = {
+    'search': 'M15.5 15.5L21 21M17 10.5a6.5 6.5 0 1 1-13 0a6.5 6.5 0 1 1 13 0',
+    'file-alt': 'M6 2h8l5 5v15H6zM14 2v5h5M9 12h7M9 16h7',
+    'moon': 'FM20 14.5A8.5 8.5 0 1 1 9.5 4a7 7 0 0 0 10.5 10.5z',
+    'sun': 'M16 12a4 4 0 1 1-8 0a4 4 0 1 1 8 0M12 2v2M12 20v2M2 12h2M20 12h2'
+           'M4.9 4.9l1.4 1.4M17.7 17.7l1.4 1.4M4.9 19.1l1.4-1.4M17.7 6.3l1.4-1.4',
+    'expand-alt': 'M14 3h7v7M21 3l-7 7M10 21H3v-7M3 21l7-7',
+    'compress-alt': 'M4 14h6v6M10 14l-7 7M20 10h-6V4M14 10l7-7',
+    'file-csv': 'M6 2h8l5 5v15H6zM14 2v5h5M9 11h7v8H9zM9 15h7M12.5 11v8',
+    'file-pdf': 'M6 2h8l5 5v15H6zM14 2v5h5M9 19v-7h2.5a2 2 0 0 1 0 4H9',
+    'copy': 'M9 9h12v12H9zM5 15H3V3h12v2',
+    'download': 'M12 3v12M7 10l5 5l5-5M4 21h16',
+    'check-circle': 'M21.5 12a9.5 9.5 0 1 1-19 0a9.5 9.5 0 1 1 19 0M8 12l3 3l5-6',
+    'exclamation-circle': 'M21.5 12a9.5 9.5 0 1 1-19 0a9.5 9.5 0 1 1 19 0M12 7v6M12 16.5v.5',
+}
+
+@lru_cache(maxsize=None)
+def offline_icon_css():
+    """Minified CSS drawing only the icons that the viewer page uses, as SVG masks."""
+    rules = ['.fas{display:inline-block;width:1em;height:1em;vertical-align:-.125em;'
+             'background:currentColor;-webkit-mask:var(--icon) center/contain no-repeat;'
+             'mask:var(--icon) center/contain no-repeat}']
+    for name in sorted(set(re.findall(r'\bfa-([a-z-]+)', _PAGE_TEMPLATE + _VIEWER_JS))):
+        path = _ICON_PATHS.get(name)
+        if path is None:
+            continue
+        if path.startswith('F'):
+            paint = f"fill='%23000' d='{path[1:]}'"
+        else:
+            paint = f"fill='none' stroke='%23000' stroke-width='2' stroke-linecap='round' stroke-linejoin='round' d='{path}'"
+        rules.append(f".fa-{name}{{--icon:url(\"data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' "
+                     f"viewBox='0 0 24 24'%3E%3Cpath {paint}/%3E%3C/svg%3E\")}}")
+    return ''.join(rules)
+
+@lru_cache(maxsize=None)
+def offline_pdf_libraries():
+    """The vendored PDF libraries as one script, or '' when any of them is missing."""
+    try:
+        return ';\n'.join((VENDOR_DIR / name).read_text(encoding='utf-8') for name in PDF_LIBRARIES)
+    except OSError:
+        return ''
+
+def _minify_css(css):
+    """Drop comments and the whitespace around CSS punctuation."""
+    css = ' '.join(re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL).split())
+    return re.sub(r' ?([{};,>]) ?', r'\1', css)
+
+def _minify_js(js):
+    """Drop indentation, blank lines and whole-line comments, keeping the line breaks.
+
+    Only whole lines are removed, so strings and regular expressions that
+    contain '//' are left alone.
+    """
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+@lru_cache(maxsize=None)
+def _viewer_assets():
+    """(css, js) of the viewer, minified as the pages and the shared bundle embed them."""
+    return _minify_css(_VIEWER_CSS), _minify_js(_VIEWER_JS)
+
+def _gzip(data):
+    """Compress data as gzip at level 9 with a zero mtime, so the output is reproducible."""
+    packed = io.BytesIO()
+    with gzip.GzipFile(fileobj=packed, mode='wb', compresslevel=9, mtime=0) as f:
+        f.write(data)
+    return packed.getvalue()
+
+def _hashed_name(stem, suffix, content):
+    return f"{stem}.{hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]}{suffix}"
+
+@lru_cache(maxsize=None)
+def _shared_assets():
+    """{role: (file name, content)} of every file the shared asset bundle can hold."""
+    assets = {
+        'viewer_css': ('viewer', '.css', _viewer_assets()[0]),
+        'viewer_js': ('viewer', '.js', _viewer_assets()[1]),
+        'icons': ('icons', '.css', offline_icon_css()),
+    }
+    if offline_pdf_libraries():
+        assets['pdf'] = ('pdf', '.js', offline_pdf_libraries())
+    return {role: (_hashed_name(stem, suffix, content), content)
+            for role, (stem, suffix, content) in assets.items()}
+
+def shared_asset_files(offline=False):
+    """Return {file name: content} of the asset bundle that pages can share.
+
+    The bundle holds viewer.css and viewer.js, plus the icons and PDF
+    libraries for offline pages. File names carry a hash of their content,
+    so a changed bundle never reuses a stale browser cache entry.
+    """
+    roles = ('viewer_css', 'viewer_js', 'icons', 'pdf') if offline else ('viewer_css', 'viewer_js')
+    return dict(asset for role, asset in _shared_assets().items() if role in roles)
+
+def write_shared_assets(asset_dir, offline=False):
+    """Write the shared asset bundle into asset_dir, skipping files already there."""
+    asset_dir = Path(asset_dir)
+    asset_dir.mkdir(parents=True, exist_ok=True)
+    for name, content in shared_asset_files(offline).items():
+        path = asset_dir / name
+        if not path.exists():
+            path.write_text(content, encoding='utf-8')
+
+@lru_cache(maxsize=None)
+def _inline_asset_fields():
+    """Page fields embedding every asset, for pages without a shared bundle."""
+    css, js = _viewer_assets()
+    fields = {
+        'viewer_css': f'<style>{css}</style>',
+        'viewer_js': f'<script>\n{js}\n</script>',
+        'icon_assets': f'<style>{offline_icon_css()}</style>',
+        'script_assets': '',
+    }
+    if offline_pdf_libraries():
+        packed = base64.b64encode(_gzip(offline_pdf_libraries().encode('utf-8')))
+        fields['script_assets'] = f'<script id="pdf-libraries" type="application/gzip">{packed.decode("ascii")}</script>'
+    return {field: value.encode('utf-8') for field, value in fields.items()}
+
+def _asset_fields(options):
+    """Page fields loading the viewer, icons and PDF libraries, as options.offline and asset_url ask."""
+    fields = dict(_inline_asset_fields())
+    if options.asset_url is not None:
+        base = options.asset_url.rstrip('/') + '/' if options.asset_url else ''
+        links = {role: base + quote(name) for role, (name, _) in _shared_assets().items()}
+        fields['viewer_css'] = f'<link rel="stylesheet" href="{html.escape(links["viewer_css"])}">'.encode('utf-8')
+        fields['viewer_js'] = f'<script src="{html.escape(links["viewer_js"])}"></script>'.encode('utf-8')
+        fields['icon_assets'] = f'<link rel="stylesheet" href="{html.escape(links["icons"])}">'.encode('utf-8')
+        if 'pdf' in links:
+            fields['script_assets'] = _pdf_library_links([links['pdf']])
+    if not options.offline:
+        fields['icon_assets'] = _CDN_ICON_ASSETS
+        fields['script_assets'] = _pdf_library_links(_CDN_PDF_LIBRARIES)
+    return fields
+
+def _pdf_library_links(urls):
+    """The #pdf-libraries placeholder naming the scripts the viewer loads, in order, on demand."""
+    return (f'<script id="pdf-libraries" type="text/plain" '
+            f'data-src="{html.escape(json.dumps(list(urls)))}"></script>').encode('utf-8')
+
+class ExportOptions:
+    """Optional export features, passed from the CLI down to each table writer.
+
+    tables: None for the first table only, 'all' for every table on one
+        page, or 'split' for one page per table.
+    typed_columns: infer column types, right-align numeric columns and add
+        a min/max/sum footer (see ColumnarTable).
+    virtual: embed the body rows as JSON and let the viewer keep only the
+        rows near the viewport in the DOM (for very large tables).
+    search_index: embed a trigram index of the cell text that the viewer's
+        search queries instead of scanning every row (see SearchIndex).
+    offline: make no network requests. Icons and the vendored PDF libraries
+        are inlined into the page, or, with asset_url, loaded from the
+        shared bundle there.
+    asset_url: URL of the directory holding the shared asset bundle (see
+        write_shared_assets), relative to the page. Pages then link the
+        viewer's CSS and JavaScript instead of embedding them. Set per page
+        from asset_dir when writing files.
+    asset_dir: directory of the shared asset bundle on disk.
+    compress: COMPRESSION_FORMATS names; each page written to a file also
+        gets a compressed copy in each format, from the same output stream.
+    compress_level: compression level for every format, capped at the
+        format's highest; None for each format's highest.
+    render_jobs: render the body rows of each table in this many processes
+        (see render_rows_parallel); 1 renders them in this process. Not
+        used with typed_columns or a profile.
+    page_rows: split the first table into linked pages of this many body
+        rows, with an index page (see convert_markdown_table_to_pages).
+    """
+
+    def __init__(self, tables=None, typed_columns=False, virtual=False, search_index=False,
+                 offline=False, asset_url=None, asset_dir=None, compress=(), compress_level=None,
+                 render_jobs=1, page_rows=None):
+        self.tables = tables
+        self.typed_columns = typed_columns
+        self.virtual = virtual
+        self.search_index = search_index
+        self.offline = offline
+        self.asset_url = asset_url
+        self.asset_dir = asset_dir
+        self.compress = tuple(compress)
+        self.compress_level = compress_level
+        self.render_jobs = render_jobs
+        self.page_rows = page_rows
+
+    def for_page(self, html_file):
+        """Options for writing html_file, with asset_url pointing from it to asset_dir."""
+        if self.asset_dir is None:
+            return self
+        options = copy.copy(self)
+        relative = os.path.relpath(Path(self.asset_dir).resolve(), Path(html_file).resolve().parent)
+        options.asset_url = quote(Path(relative).as_posix())
+        return options
+
+    def cache_key(self):
+        """Describe the options that change the output, for BuildCache."""
+        # The number of render processes never changes the page
+        return json.dumps({name: value for name, value in vars(self).items() if name != 'render_jobs'},
+                          sort_keys=True)
+
+DEFAULT_OPTIONS = ExportOptions()
+
+# Characters allowed in int/float columns (with newlines joining the cells)
+_INT_CHARS = str.maketrans('', '', '0123456789,+-\n')
+_FLOAT_CHARS = str.maketrans('', '', '0123456789,+-.eE\n')
+_DATE_COLUMN_RE = re.compile(r'(?:\d{4}-\d{2}-\d{2})?(?:\n(?:\d{4}-\d{2}-\d{2})?)*')
+_DECIMALS_RE = re.compile(r'\.(\d+)')
+# A number with a leading zero, such as an ID or a code: '007', '-01'
+_LEADING_ZERO_RE = re.compile(r'(?<![\d.,eE])0\d')
+# Where a number has commas, they must separate groups of three digits
+_GROUPED_NUMBER_RE = re.compile(r'[+-]?\d{1,3}(?:,\d{3})+(?:\.\d*)?(?:[eE][+-]?\d+)?')
+
+# Rows read at a time by ColumnarTable before they are split into columns
+_COLUMN_CHUNK_ROWS = 4096
+
+class ColumnarTable:
+    """Column-oriented model of a table's rows with inferred column types.
+
+    Each column's type (int, float, date or text) is inferred from the whole
+    column at once: the cells are joined with newlines, checked against the
+    type's character set and parsed in one map() call. Numeric columns are
+    held in array.array, so parsing and the min/max/sum summary run as
+    batched builtin calls rather than Python loops over cells. Numeric cells
+    are shown as written; the values only align them and feed the summary.
+    Only text columns go through the cell renderer.
+
+    Cells are interned as they are read, so a value repeated down a column
+    is stored once, and each column keeps only the cells rendering needs.
+    """
+
+    def __init__(self, header, rows):
+        self.header = header
+        col_count = len(header)
+
+        # Read the rows a chunk at a time straight into columns of interned
+        # cells, so each repeated value is stored once and no row outlives
+        # its chunk
+        raw_columns = [[] for _ in range(col_count)]
+        rows = iter(rows)
+        while True:
+            chunk = [fit_row(row, col_count) for row in islice(rows, _COLUMN_CHUNK_ROWS)]
+            if not chunk:
+                break
+            for column, cells in zip(raw_columns, zip(*chunk)):
+                column.extend(map(sys.intern, cells))
+
+        # Classify rows column-wise: a category row has text in its first
+        # column only
+        stripped = [list(map(sys.intern, map(str.strip, column))) for column in raw_columns]
+        rest_filled = map(any, zip(*stripped[1:])) if col_count > 1 else repeat(False)
+        self.is_category = bytearray(map(operator.and_, map(bool, stripped[0]), map(operator.not_, rest_filled)))
+        is_data = bytes(map(operator.not_, self.is_category))
+
+        self.category_labels = list(compress(raw_columns[0], self.is_category))
+        self.raw_columns = []
+        self.columns = []
+        self.types = []
+        self.values = []
+        for index in range(col_count):
+            column = list(compress(stripped[index], is_data))
+            stripped[index] = None
+            kind, values = _parse_column(column)
+            self.types.append(kind)
+            self.values.append(values)
+            # Keep only what rendering and the summary read: the raw cells of
+            # text columns, the stripped cells of numeric and date columns
+            self.raw_columns.append(list(compress(raw_columns[index], is_data)) if kind in ('text', 'date')
+                                    else None)
+            self.columns.append(column if kind != 'text' else None)
+            raw_columns[index] = None
+
+    def is_numeric(self, index):
+        return self.types[index] in ('int', 'float')
+
+    def summary(self, index):
+        """Return (min, max, sum) of a column as display strings, or None."""
+        kind = self.types[index]
+        if kind == 'date':
+            present = [cell for cell in self.columns[index] if cell]
+            return min(present), max(present), ''
+        values = self.values[index]
+        if not values:
+            return None
+        formatter = self._formatter(index)
+        total = sum(values) if kind == 'int' else math.fsum(values)
+        return formatter(min(values)), formatter(max(values)), formatter(total)
+
+    def _formatter(self, index):
+        """Format a numeric column's values with one precision and separator style."""
+        joined = '\n'.join(self.columns[index])
+        if self.types[index] == 'int':
+            return '{:,}'.format if ',' in joined else str
+        if 'e' in joined or 'E' in joined:
+            return repr
+        decimals = max(map(len, _DECIMALS_RE.findall(joined)), default=0)
+        separator = ',' if ',' in joined else ''
+        return f'{{:{separator}.{decimals}f}}'.format
+
+    def render_cells(self, index, render_cell):
+        """Return one <td> fragment per data row for column index."""
+        if not self.is_numeric(index):
+            return list(map('<td>{}</td>'.format, map(render_cell, self.raw_columns[index])))
+        return list(map('<td class="num">{}</td>'.format, self.columns[index]))
+
+    def search_texts(self):
+        """Yield each row's cell texts for SearchIndex.add_row, None for category rows.
+
+        Numeric cells are indexed as written.
+        """
+        columns = [list(map(str.lower, self.columns[index])) if self.is_numeric(index)
+                   else list(map(_cell_search_text, self.raw_columns[index]))
+                   for index in range(len(self.header))]
+        data_rows = zip(*columns)
+        for is_category in self.is_category:
+            yield None if is_category else next(data_rows)
+
+    def render_rows(self, render_cell):
+        """Yield one <tr> fragment per row, in the original order."""
+        col_count = len(self.header)
+        data_rows = map('<tr>{}</tr>'.format, map(''.join, zip(*[self.render_cells(index, render_cell)
+                                                                 for index in range(col_count)])))
+        if not any(self.is_category):
+            yield from data_rows
+            return
+        labels = iter(self.category_labels)
+        for is_category in self.is_category:
+            if is_category:
+                yield f'<tr class="category-row"><td colspan="{col_count}">{render_cell(next(labels))}</td></tr>'
+            else:
+                yield next(data_rows)
+
+    def render_footer(self):
+        """Return a <tfoot> with min/max/sum rows, or '' without summarised columns."""
+        summaries = [self.summary(index) if self.types[index] != 'text' else None
+                     for index in range(len(self.header))]
+        if not any(summaries):
+            return ''
+        footer = ['<tfoot>']
+        for position, label in enumerate(('Min', 'Max', 'Sum')):
+            cells = []
+            for index, summary in enumerate(summaries):
+                value = summary[position] if summary else ''
+                if index == 0 and not summary:
+                    value = label
+                css = ' class="num"' if self.is_numeric(index) else ''
+                cells.append(f'<td{css}>{value}</td>')
+            footer.append(f'<tr class="summary-row" title="{label}">{"".join(cells)}</tr>')
+        footer.append('</tfoot>')
+        return ''.join(footer)
+
+def _parse_column(column):
+    """Infer the type of a column of stripped cell texts.
+
+    Returns (type, array of the non-empty values) for int and float columns,
+    and (type, None) for date and text columns. A column is numeric only if
+    every value is held exactly: leading zeros, commas out of place, integers
+    past 64 bits and decimals a float cannot represent keep it text.
+    """
+    joined = '\n'.join(column)
+    if not joined.strip():
+        return 'text', None
+    present = len(column) - column.count('')
+    numeric = not _LEADING_ZERO_RE.search(joined)
+    if numeric and ',' in joined:
+        numeric = all(map(_GROUPED_NUMBER_RE.fullmatch, [cell for cell in column if ',' in cell]))
+    for kind, typecode, chars, convert in (('int', 'q', _INT_CHARS, int),
+                                           ('float', 'd', _FLOAT_CHARS, float)):
+        if not numeric or joined.translate(chars):
+            continue
+        texts = joined.replace(',', '').split()
+        try:
+            values = array(typecode, map(convert, texts))
+        except (ValueError, OverflowError):
+            continue
+        if kind == 'float' and list(map(Decimal, map(repr, values))) != list(map(Decimal, texts)):
+            continue  # Rounded, or out of range
+        if len(values) == present:
+            return kind, values
+    if _DATE_COLUMN_RE.fullmatch(joined):
+        return 'date', None
+    return 'text', None
+
+# What a browser reads as a tag: '<' followed by a letter, '/' and a letter, or
+# '!'. Any other '<' is text, as in 'x < 5'.
+_TAG_RE = re.compile(r'<(?:/?[A-Za-z][^>]*|!--.*?--|![^>]*)>', re.DOTALL)
+
+@lru_cache(maxsize=CELL_CACHE_SIZE)
+def _cell_search_text(cell):
+    """The lowercased text the viewer's search compares for one cell, from the cell's source.
+
+    Cells without markup are shown as written, less character references;
+    others are rendered, then stripped of tags and unescaped on their own,
+    so nothing in one cell can reach into the next.
+    """
+    if _MARKUP_CHARS_RE.search(cell):
+        cell = _TAG_RE.sub('', process_cell_content(cell))
+    return (html.unescape(cell) if '&' in cell else cell).lower()
+
+class SearchIndex:
+    """Trigram inverted index over the cell text of one table's body rows.
+
+    Maps each three-character substring of a lowercased cell text to the
+    body rows containing it; cells shorter than that are indexed whole.
+    The viewer intersects the lists for a search term's trigrams and only
+    checks those candidate rows. Category rows are counted but not indexed,
+    as search always keeps them visible. Each cell is indexed from its own
+    source text (see _cell_search_text), never from the row's markup.
+    """
+
+    GRAM = 3
+
+    def __init__(self):
+        self.postings = defaultdict(partial(array, 'I'))
+        self.row_count = 0
+
+    def add_row(self, texts):
+        """Index the next body row from its cells' search texts; None for a category row."""
+        row = self.row_count
+        self.row_count += 1
+        if texts is None:
+            return
+        gram = self.GRAM
+        grams = set()
+        for text in texts:
+            if len(text) < gram:
+                if text:
+                    grams.add(text)
+                continue
+            grams.update([text[i:i + gram] for i in range(len(text) - gram + 1)])
+        postings = self.postings
+        for key in grams:
+            postings[key].append(row)
+
+    def add_cells(self, row, col_count):
+        """Index the next body row from its parsed cells, padded in place to col_count."""
+        fit_row(row, col_count)
+        self.add_row(None if _is_category_row(row) else list(map(_cell_search_text, row)))
+
+    def track(self, rows, col_count):
+        """Yield parsed rows unchanged while indexing each one."""
+        for row in rows:
+            self.add_cells(row, col_count)
+            yield row
+
+    def track_lines(self, lines, col_count):
+        """Yield body lines unchanged while indexing each one's cells."""
+        for line in lines:
+            self.add_cells(parse_md_row(line), col_count)
+            yield line
+
+    def write(self, out, table_id):
+        """Write the index as JSON, with each row list delta-encoded."""
+        out.write(f'\n<script type="application/json" class="search-index" data-table="{table_id}">'
+                  f'{{"gram":{self.GRAM},"rows":{self.row_count},"postings":{{'.encode('utf-8'))
+        separator = ''
+        # Sorted keys keep the page identical between runs
+        for key, rows in sorted(self.postings.items()):
+            deltas = ','.join(map(str, map(operator.sub, rows, chain((0,), rows))))
+            entry = f'{separator}{json.dumps(key, ensure_ascii=False)}:[{deltas}]'
+            out.write(_escape_script_json(entry).encode('utf-8'))
+            separator = ','
+        out.write(b'}}</script>')
+
+def _escape_script_json(text):
+    """Keep JSON embedded in a <script> element from closing it early."""
+    return text.replace('</', '<\\/').replace('<!--', '<\\u0021--')
+
+def _write_table(out, header_line, separator_line, lines, table_id, render_cell, spool, options, profile=None):
+    """Write one table's markup while spooling its raw Markdown.
+
+    Returns the (start, end) byte range of the table's Markdown in spool.
+    """
+    parse_row, is_category_row, columnar_table = parse_md_row, _is_category_row, ColumnarTable
+    if profile is not None:
+        lines = profile.iterate('detect', lines)
+        parse_row = profile.wrap('parse', parse_row)
+        is_category_row = profile.wrap('category', is_category_row)
+        columnar_table = profile.wrap('columns', columnar_table)
+    start = spool.tell()
+    spool.write(f'{header_line}\n{separator_line}'.encode('utf-8'))
+    header = parse_row(header_line)
     col_count = len(header)
-    normalized_rows = []
-    for row in content_rows:
-        padded = row + [''] * (col_count - len(row))
-        normalized_rows.append(padded[:col_count])
+    body_lines = _tee_lines(lines, spool)
+    search_index = None
+    if options.search_index:
+        search_index = SearchIndex()
+        if profile is not None:
+            search_index.add_row = profile.wrap('index', search_index.add_row)
+            search_index.add_cells = profile.wrap('index', search_index.add_cells)
+    parallel = options.render_jobs > 1 and profile is None and not options.typed_columns
+    if search_index is not None and parallel:
+        body_lines = search_index.track_lines(body_lines, col_count)
+    rows = (parse_row(line) for line in body_lines)
+    if search_index is not None and not parallel and not options.typed_columns:
+        rows = search_index.track(rows, col_count)
+
+    table_class = 'markdown-table virtual-table' if options.virtual else 'markdown-table'
+    out.write(f'<div class="table-container"><table id="{table_id}" class="{table_class}"><thead><tr>'.encode('utf-8'))
+    if options.typed_columns:
+        # Typed columns need the whole table before the first row is written
+        table = columnar_table(header, rows)
+        out.write(''.join([f'<th class="num">{render_cell(cell)}</th>' if table.is_numeric(index)
+                           else f'<th>{render_cell(cell)}</th>'
+                           for index, cell in enumerate(header)]).encode('utf-8'))
+        if search_index is not None:
+            for texts in table.search_texts():
+                search_index.add_row(texts)
+        fragments = table.render_rows(render_cell)
+        footer = table.render_footer()
+    else:
+        out.write(''.join([f'<th>{render_cell(cell)}</th>' for cell in header]).encode('utf-8'))
+        if parallel:
+            fragments = render_rows_parallel(body_lines, col_count, render_cell, options.render_jobs)
+        else:
+            fragments = render_table_rows(rows, col_count, render_cell, is_category_row)
+        footer = ''
+
+    if options.virtual:
+        out.write(b'</tr></thead><tbody></tbody>')
+        out.write(f'{footer}</table></div>'.encode('utf-8'))
+        _write_virtual_rows(out, table_id, fragments)
+    else:
+        out.write(b'</tr></thead><tbody>')
+        for fragment in fragments:
+            out.write(fragment.encode('utf-8'))
+        out.write(f'</tbody>{footer}</table></div>'.encode('utf-8'))
+    if search_index is not None:
+        search_index.write(out, table_id)
+    return start, spool.tell()
+
+# Rows are JSON-encoded this many at a time when writing a virtual table
+_VIRTUAL_CHUNK_ROWS = 1024
+
+def _write_virtual_rows(out, table_id, fragments):
+    """Write a table's <tr> fragments as a JSON array for the virtualized viewer."""
+    out.write(f'\n<script type="application/json" class="table-rows" data-table="{table_id}">['.encode('utf-8'))
+    separator = b''
+    fragments = iter(fragments)
+    while True:
+        chunk = list(islice(fragments, _VIRTUAL_CHUNK_ROWS))
+        if not chunk:
+            break
+        encoded = json.dumps(chunk, ensure_ascii=False, separators=(',', ':'))[1:-1]
+        out.write(separator)
+        out.write(_escape_script_json(encoded).encode('utf-8'))
+        separator = b','
+    out.write(b']</script>')
+
+def _original_md_writer(spool, sources):
+    """Return a page field writer embedding each table's raw Markdown (used for PDF export).
+
+    sources lists (table_id, table, start, end) spool ranges and may still be
+    filled in after the writer is created.
+    """
+    def write(out):
+        for index, (table_id, table, start, end) in enumerate(sources):
+            attrs = ' id="original-md"' if index == 0 else ''
+            if table is not None:
+                attrs += f' data-lines="{table.start_line}-{table.end_line}"'
+                if table.heading:
+                    attrs += f' data-heading="{html.escape(table.heading)}"'
+            if index:
+                out.write(b'\n    ')
+            out.write(f'<script{attrs} class="original-md" type="text/plain" data-table="{table_id}">\n        '.encode('utf-8'))
+            spool.seek(start)
+            remaining = end - start
+            while remaining:
+                block = spool.read(min(remaining, 64 * 1024))
+                out.write(block)
+                remaining -= len(block)
+            out.write(b'\n    </script>')
+    return write
+
+# Rows between two calls of a conversion's progress callback
+PROGRESS_INTERVAL = 1000
+
+def _report_progress(lines, progress):
+    """Yield lines unchanged, calling progress(rows so far) every PROGRESS_INTERVAL rows and at the end."""
+    count = 0
+    for count, line in enumerate(lines, 1):
+        if count % PROGRESS_INTERVAL == 0:
+            progress(count)
+        yield line
+    progress(count)
+
+def convert_markdown_table_to_html(md_file, html_file, render_cell=process_cell_content, options=None,
+                                   progress=None, lines=None, profile=None):
+    """Convert the first table in md_file to a viewer page at html_file.
+
+    render_cell renders one cell's text; pass cached_cell_renderer() to memoize
+    repeated cells. options is an ExportOptions. progress, if given, is called
+    with the number of body rows read so far; an exception it raises stops the
+    conversion and propagates, leaving html_file incomplete. lines, if given,
+    are md_file's lines (without line endings) already read by the caller, and
+    md_file is not opened. profile, a ConversionProfile, collects the time
+    spent in each stage. Returns True on success; errors are printed and
+    return False.
+    """
+    result = _convert_file_to_file(md_file, html_file, render_cell, options, progress, lines,
+                                   all_tables=False, profile=profile)
+    if result.ok:
+        print(f"✅ HTML export completed: {html_file}")
+    return result.ok
+
+def _convert_file_to_file(md_file, html_file, render_cell, options, progress, lines, all_tables,
+                          profile=None):
+    """Run _convert from md_file (or its lines) into html_file, printing any error."""
+    tables = iter_mapped_tables(md_file) if lines is None else None
+    options = (options or DEFAULT_OPTIONS).for_page(html_file)
+    out = _page_output(html_file, options)
+    try:
+        with closing(out):
+            result = _convert(lines, out, str(md_file), render_cell, options, progress, all_tables,
+                              profile=profile, tables=tables)
+    except FileNotFoundError as e:
+        # Only a missing input is a conversion error
+        if e.filename is None or os.fspath(e.filename) != os.fspath(md_file):
+            raise
+        result = _failed('not_found', f"File '{md_file}' not found.")
+    if not result.ok:
+        print(f"Error: {result.error}")
+    elif options.compress:
+        out.report()
+    return result
+
+class _LazyOutput:
+    """A binary file opened on the first write, so a failed conversion creates no file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+
+    def write(self, data):
+        if self.file is None:
+            self.file = open(self.path, 'wb')
+        return self.file.write(data)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+# Compressed copies a page can be written with: format: (file suffix, highest level)
+COMPRESSION_FORMATS = {'gzip': ('.gz', 9), 'br': ('.br', 11)}
+
+def available_compression_formats():
+    """The COMPRESSION_FORMATS usable here; 'br' needs the brotli package."""
+    return [name for name in COMPRESSION_FORMATS if name != 'br' or brotli is not None]
+
+def _compressor(name, level):
+    """Return the (compress, finish) functions of a streaming compressor.
+
+    level defaults to, and is capped at, the format's highest level.
+    """
+    _, max_level = COMPRESSION_FORMATS[name]
+    level = max_level if level is None else max(0, min(level, max_level))
+    if name == 'gzip':
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31: gzip container
+        return compressor.compress, compressor.flush
+    compressor = brotli.Compressor(quality=level)
+    return compressor.process, compressor.finish
+
+class _CompressedCopy:
+    """One compressed copy of a page: its output, compressor functions and size so far."""
+
+    __slots__ = ('out', 'compress', 'flush', 'size')
+
+    def __init__(self, out, compress, flush):
+        self.out = out
+        self.compress = compress
+        self.flush = flush
+        self.size = 0
+
+    def write(self, data):
+        self.out.write(data)
+        self.size += len(data)
+
+class _CompressedOutputs:
+    """A page file and compressed copies of it, written in the same pass.
+
+    Writes are gathered into blocks, and each block goes to the page and
+    to every compressor. As with _LazyOutput, no file is created before
+    the first write.
+    """
+
+    BLOCK_SIZE = 256 * 1024
+
+    def __init__(self, html_file, formats, level=None):
+        self.page = _LazyOutput(html_file)
+        self.copies = [_CompressedCopy(_LazyOutput(f'{html_file}{COMPRESSION_FORMATS[name][0]}'),
+                                       *_compressor(name, level))
+                       for name in formats]
+        self.block = bytearray()
+        self.size = 0
+
+    def write(self, data):
+        self.block += data
+        if len(self.block) >= self.BLOCK_SIZE:
+            self._write_block()
+        return len(data)
+
+    def _write_block(self):
+        block = bytes(self.block)
+        self.block.clear()
+        self.size += len(block)
+        self.page.write(block)
+        for compressed in self.copies:
+            compressed.write(compressed.compress(block))
+
+    def close(self):
+        try:
+            if self.block:
+                self._write_block()
+            if self.page.file is not None:
+                for compressed in self.copies:
+                    compressed.write(compressed.flush())
+        finally:
+            self.page.close()
+            for compressed in self.copies:
+                compressed.out.close()
+
+    def report(self):
+        """Print each compressed copy's size and ratio to the page."""
+        for compressed in self.copies:
+            ratio = compressed.size / self.size if self.size else 0.0
+            print(f"📦 {compressed.out.path}: {compressed.size:,} bytes ({ratio:.1%} of {self.size:,})")
+
+def _page_output(html_file, options):
+    """Open the output for a page, with compressed copies when options.compress asks for them."""
+    if options.compress:
+        return _CompressedOutputs(html_file, options.compress, options.compress_level)
+    return _LazyOutput(html_file)
+
+def compressed_copies(html_file, options):
+    """Paths of the compressed copies written next to html_file."""
+    return [Path(f'{html_file}{COMPRESSION_FORMATS[name][0]}') for name in options.compress]
+
+class MarkdownTable:
+    """A table located by iter_markdown_tables.
+
+    lines yields the table's lines and must be consumed before the scan moves
+    on; end_line is final once it is exhausted. Line numbers start at 1.
+    """
+
+    def __init__(self, index, start_line, heading):
+        self.index = index
+        self.start_line = start_line
+        self.end_line = start_line
+        self.heading = heading
+        self.lines = None
+
+_MD_HEADING_RE = re.compile(r' {0,3}#{1,6}\s+(.*?)[\s#]*$')
+# Fenced code blocks: an opening ``` or ~~~ (a backtick fence's info string
+# has no backticks) is closed by a run of the same character at least as long
+_MD_FENCE_OPEN_RE = re.compile(r' {0,3}(`{3,}(?=[^`]*$)|~{3,})')
+_MD_FENCE_CLOSE_RE = re.compile(r' {0,3}(`{3,}|~{3,})\s*$')
+
+def _fence_open(line):
+    """The fence that line opens, or None."""
+    match = _MD_FENCE_OPEN_RE.match(line)
+    return match.group(1) if match else None
+
+def _fence_closes(line, fence):
+    """Whether line closes the code block opened by fence."""
+    match = _MD_FENCE_CLOSE_RE.match(line)
+    return bool(match) and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence)
+
+def iter_markdown_tables(lines):
+    """Scan lines once and yield a MarkdownTable for every table found.
+
+    Each table records its line range and the nearest heading above it.
+    Tables are yielded as soon as they start, so their lines can be streamed.
+    Headings and '|' lines inside fenced code blocks are skipped.
+    """
+    numbered = enumerate(lines, 1)
+    pending = None  # A line read past the end of a table, still to be scanned
+    heading = None
+    fence = None
+    index = 0
+
+    def table_lines(table, first_line):
+        nonlocal pending
+        yield first_line
+        for number, line in numbered:
+            if not line.strip().startswith('|'):
+                pending = (number, line)
+                return
+            table.end_line = number
+            yield line
+
+    while True:
+        if pending is not None:
+            number, line = pending
+            pending = None
+        else:
+            item = next(numbered, None)
+            if item is None:
+                return
+            number, line = item
+
+        if fence is not None:
+            if _fence_closes(line, fence):
+                fence = None
+            continue
 
-    # Prepare original markdown (used for exporting as PDF)
-    original_md = '\n'.join(table_lines)
+        if line.strip().startswith('|'):
+            table = MarkdownTable(index, number, heading)
+            table.lines = table_lines(table, line)
+            yield table
+            # Skip whatever the consumer left unread
+            for _ in table.lines:
+                pass
+            index += 1
+            continue
 
+        fence = _fence_open(line)
+        if fence is not None:
+            continue
+        match = _MD_HEADING_RE.match(line)
+        if match:
+            heading = match.group(1)
+
+def _iter_complete_tables(tables):
+    """Yield (table, header_line, separator_line) for tables with at least two lines."""
+    for table in tables:
+        header_line = next(table.lines)
+        separator_line = next(table.lines, None)
+        if separator_line is not None:
+            yield table, header_line, separator_line
+
+# Table discovery over a memory-mapped file: a line belongs to a table when
+# its first non-blank byte is '|', as for iter_markdown_tables
+_MAPPED_BLANKS = b' \t\f\v\r'
+# Bytes decoded or counted at a time from a mapped file
+_MAPPED_BLOCK_SIZE = 1024 * 1024
+
+def iter_mapped_tables(md_file):
+    """Yield a MarkdownTable for every table in md_file, like iter_markdown_tables.
+
+    The file is memory-mapped and searched as bytes: candidate lines are
+    found with mmap.find() for '|', and headings by searching back from
+    each table for '#'. Fenced code blocks are found the same way, from
+    '```' and '~~~', and skipped whole. Only the tables, the heading lines
+    and the fence lines are decoded; the rest of the document is never
+    decoded or split into lines. The tables' lines are decoded block by
+    block as they are read.
+    """
+    with open(md_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            position = 0
+            line_number = 1
+            heading = None
+            index = 0
+            while True:
+                start = _find_mapped_table(mapped, position)
+                fence = _find_mapped_fence(mapped, position, len(mapped) if start < 0 else start)
+                if fence is not None:
+                    # Skip the code block, and any table found inside it
+                    fence_start, fence_end = fence
+                    found = _find_mapped_heading(mapped, position, fence_start)
+                    if found is not None:
+                        heading = found
+                    line_number += _count_mapped_lines(mapped, position, fence_end)
+                    position = fence_end
+                    continue
+                if start < 0:
+                    return
+                end = _find_mapped_table_end(mapped, start)
+                found = _find_mapped_heading(mapped, position, start)
+                if found is not None:
+                    heading = found
+                line_number += _count_mapped_lines(mapped, position, start)
+                table = MarkdownTable(index, line_number, heading)
+                line_count = _count_mapped_lines(mapped, start, end)
+                if mapped[end - 1:end] != b'\n':
+                    line_count += 1  # The file's last line has no line ending
+                table.end_line = line_number + line_count - 1
+                table.lines = _iter_mapped_lines(mapped, start, end)
+                yield table
+                line_number += line_count
+                position = end
+                index += 1
+
+def _find_mapped_table(mapped, position):
+    """Offset of the first table line starting at or after position (a line start), or -1."""
+    while True:
+        pipe = mapped.find(b'|', position)
+        if pipe < 0:
+            return -1
+        line_start = mapped.rfind(b'\n', position, pipe) + 1 or position
+        if not mapped[line_start:pipe].strip(_MAPPED_BLANKS):
+            return line_start
+        line_end = mapped.find(b'\n', pipe)
+        if line_end < 0:
+            return -1
+        position = line_end + 1
+
+def _find_mapped_table_end(mapped, start):
+    """Offset just past the last line of the table starting at start, testing one line at a time."""
+    size = len(mapped)
+    position = start
+    while position < size:
+        line_end = mapped.find(b'\n', position)
+        next_line = size if line_end < 0 else line_end + 1
+        if not mapped[position:next_line].lstrip(_MAPPED_BLANKS).startswith(b'|'):
+            return position
+        position = next_line
+    return size
+
+def _mapped_line(mapped, start, end):
+    """mapped[start:end], one line, as text without its line ending."""
+    return mapped[start:end].decode('utf-8', 'replace').rstrip('\r\n')
+
+def _find_mapped_fence(mapped, start, end):
+    """(start, end) offsets of the first fenced code block opening in mapped[start:end], or None.
+
+    start is a line start; the block runs to the end of its closing fence
+    line, or of the file when it is never closed.
+    """
+    position = start
+    while True:
+        hits = [hit for hit in (mapped.find(b'```', position, end), mapped.find(b'~~~', position, end))
+                if hit >= 0]
+        if not hits:
+            return None
+        hit = min(hits)
+        line_start = mapped.rfind(b'\n', position, hit) + 1 or position
+        line_end = mapped.find(b'\n', hit)
+        next_line = len(mapped) if line_end < 0 else line_end + 1
+        fence = _fence_open(_mapped_line(mapped, line_start, next_line))
+        if fence is not None:
+            return line_start, _find_mapped_fence_end(mapped, next_line, fence)
+        position = next_line
+
+def _find_mapped_fence_end(mapped, position, fence):
+    """Offset past the line at or after position that closes fence, or the end of the file."""
+    marker = fence[:3].encode('ascii')
+    while True:
+        hit = mapped.find(marker, position)
+        if hit < 0:
+            return len(mapped)
+        line_start = mapped.rfind(b'\n', position, hit) + 1 or position
+        line_end = mapped.find(b'\n', hit)
+        next_line = len(mapped) if line_end < 0 else line_end + 1
+        if _fence_closes(_mapped_line(mapped, line_start, next_line), fence):
+            return next_line
+        position = next_line
+
+def _find_mapped_heading(mapped, start, end):
+    """Text of the last Markdown heading in mapped[start:end] (whole lines), or None."""
+    while True:
+        mark = mapped.rfind(b'#', start, end)
+        if mark < 0:
+            return None
+        line_start = mapped.rfind(b'\n', start, mark) + 1 or start
+        line_end = mapped.find(b'\n', mark, end)
+        line = mapped[line_start:end if line_end < 0 else line_end].decode('utf-8', 'replace')
+        match = _MD_HEADING_RE.match(line[:-1] if line.endswith('\r') else line)
+        if match:
+            return match.group(1)
+        end = line_start
+
+def _count_mapped_lines(mapped, start, end):
+    """Count the line endings in mapped[start:end], one block at a time."""
+    return sum(mapped[offset:min(offset + _MAPPED_BLOCK_SIZE, end)].count(b'\n')
+               for offset in range(start, end, _MAPPED_BLOCK_SIZE))
+
+def _iter_mapped_lines(mapped, start, end):
+    """Yield the lines of mapped[start:end] as text without line endings, decoding a block at a time."""
+    decode = codecs.getincrementaldecoder('utf-8')().decode
+    pending = ''
+    for offset in range(start, end, _MAPPED_BLOCK_SIZE):
+        lines = (pending + decode(mapped[offset:min(offset + _MAPPED_BLOCK_SIZE, end)])).split('\n')
+        pending = lines.pop()
+        for line in lines:
+            # Universal newlines, as when reading the file as text
+            yield line[:-1] if line.endswith('\r') else line
+    pending += decode(b'', True)
+    if pending:
+        yield pending[:-1] if pending.endswith('\r') else pending
+
+def count_file_lines(md_file):
+    """Number of lines in md_file, counted on a memory-mapped view without decoding it."""
+    with open(md_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            count = _count_mapped_lines(mapped, 0, len(mapped))
+            return count if mapped[-1:] == b'\n' else count + 1
+
+def convert_markdown_tables_to_html(md_file, html_file, render_cell=process_cell_content, split=False,
+                                    options=None, profile=None):
+    """Convert every table in md_file in a single pass over the input.
+
+    All tables go into one page at html_file, each under its nearest heading.
+    With split, each table gets its own page named <stem>-<n><suffix> next to
+    html_file. profile works as in convert_markdown_table_to_html. Returns a
+    list of (page path, MarkdownTable) pairs; errors are printed and return
+    an empty list.
+    """
+    if split:
+        written = _convert_split_tables(md_file, Path(html_file), render_cell, options or DEFAULT_OPTIONS,
+                                        profile)
+    else:
+        result = _convert_file_to_file(md_file, html_file, render_cell, options, None, None,
+                                       all_tables=True, profile=profile)
+        written = [(Path(html_file), table) for table in result.tables]
+
+    for number, (page, table) in enumerate(written, 1):
+        heading = f" ({table.heading})" if table.heading else ""
+        print(f"✅ Table {number}, lines {table.start_line}-{table.end_line}{heading}: {page}")
+    return written
+
+def _convert_split_tables(md_file, html_file, render_cell, options, profile=None):
+    """Write each complete table in md_file to its own page; return (page, table) pairs."""
+    options = options.for_page(html_file)
+    tables = iter_mapped_tables(md_file)
+    running = nullcontext()
+    if profile is not None:
+        tables = profile.iterate('detect', profile.read_tables(tables))
+        render_cell = profile.wrap('render', render_cell)
+        running = profile.running()
+    tables = _iter_complete_tables(tables)
+    tally = _RowTally()
+    with closing(tables), running:
+        try:
+            first = next(tables, None)
+        except FileNotFoundError:
+            print(f"Error: File '{md_file}' not found.")
+            return []
+        if first is None:
+            print(f"Error: {_NO_TABLE_MESSAGE}")
+            return []
+
+        pdf_title = os.path.splitext(os.path.basename(md_file))[0]
+        written = []
+        for number, table in enumerate(chain([first], tables), 1):
+            page = html_file.with_name(f'{html_file.stem}-{number}{html_file.suffix}')
+            output = _page_output(page, options)
+            with closing(output):
+                out = output if profile is None else _ProfiledOutput(output, profile)
+                _write_tables_page(out, str(md_file), f'{pdf_title}-{number}', [table],
+                                   render_cell, options, tally, profile=profile)
+            if options.compress:
+                output.report()
+            written.append((page, table[0]))
+    if profile is not None:
+        profile.rows += tally.total
+        profile.tables += len(written)
+    return written
+
+def convert_markdown_table_to_pages(md_file, html_file, page_rows, render_cell=process_cell_content,
+                                    options=None, profile=None):
+    """Convert the first table in md_file to linked pages of page_rows body rows each.
+
+    The pages are named <stem>-0001<suffix>, <stem>-0002<suffix>, ... next
+    to html_file, which becomes an index page listing them. Every page links
+    to its neighbours and to the index, and links the shared asset bundle in
+    options.asset_dir (html_file's folder by default) instead of embedding
+    the viewer. A category row never ends a page, and a page that starts
+    inside a category repeats that category's row at the top. Only one page
+    of lines is held at a time. profile works as in
+    convert_markdown_table_to_html. Returns the paths written, the index
+    first; errors are printed and return an empty list.
+    """
+    html_file = Path(html_file)
+    options = copy.copy(options or DEFAULT_OPTIONS)
+    if options.asset_dir is None:
+        options.asset_dir = html_file.parent
+    tables = iter_mapped_tables(md_file)
+    running = nullcontext()
+    if profile is not None:
+        tables = profile.iterate('detect', profile.read_tables(tables))
+        render_cell = profile.wrap('render', render_cell)
+        running = profile.running()
+    tally = _RowTally()
+    with closing(tables), running:
+        try:
+            table = next(tables, None)
+        except FileNotFoundError:
+            print(f"Error: File '{md_file}' not found.")
+            return []
+        if table is None:
+            print(f"Error: {_NO_TABLE_MESSAGE}")
+            return []
+        header_line = next(table.lines)
+        separator_line = next(table.lines, None)
+        if separator_line is None:
+            print("Error: Table must have at least header and separator.")
+            return []
+        write_shared_assets(options.asset_dir, options.offline)
+
+        pdf_title = os.path.splitext(os.path.basename(md_file))[0]
+        col_count = len(parse_md_row(header_line))
+        written = []
+        contents = []
+        for number, (lines, first_row, last_row, more, categories) in enumerate(
+                _iter_table_pages(table.lines, page_rows, col_count), 1):
+            page = _numbered_page(html_file, number)
+            page_options = options.for_page(page)
+            page_table = MarkdownTable(table.index, table.start_line, table.heading)
+            page_table.lines = iter(lines)
+            nav = _page_nav(html_file, number, more, f'rows {first_row:,}–{last_row:,}')
+            output = _page_output(page, page_options)
+            with closing(output):
+                out = output if profile is None else _ProfiledOutput(output, profile)
+                _write_table_page(out, str(md_file), f'{pdf_title}-{number}', page_table, header_line,
+                                  separator_line, render_cell, page_options, tally, profile=profile,
+                                  page_nav=nav)
+            if options.compress:
+                output.report()
+            written.append(page)
+            contents.append((page, first_row, last_row, categories))
+
+    _write_page_index(html_file, str(md_file), pdf_title, contents, options)
+    if profile is not None:
+        profile.rows += tally.total
+        profile.tables += 1
+    print(f"✅ HTML export completed: {html_file} (index of {len(written)} page(s) "
+          f"of up to {page_rows:,} rows)")
+    return [html_file] + written
+
+# Category labels listed per page in the index of a paginated table
+_INDEX_CATEGORIES = 5
+
+def _iter_table_pages(lines, page_rows, col_count):
+    """Split a table's body lines into pages of page_rows rows.
+
+    Yields (page lines, first row, last row, more, category labels): rows
+    are numbered from 1 over the table's own lines, more tells whether
+    another page follows, and the labels are those of the categories on the
+    page. A category row that would be the last row of a page starts the
+    next page instead; a page that starts inside a category gets that
+    category's line first, which is not counted as a row.
+    """
+    lines = iter(lines)
+    carried = []
+    category = None
+    first_row = 1
+    while True:
+        rows = carried + list(islice(lines, page_rows - len(carried)))
+        if not rows:
+            return
+        following = next(lines, None)
+        carried = [] if following is None else [following]
+        if following is not None and len(rows) > 1 and _category_label(rows[-1], col_count) is not None:
+            carried.insert(0, rows.pop())
+
+        page = rows
+        categories = []
+        if category is not None and _category_label(rows[0], col_count) is None:
+            page = [category[0]] + rows
+            categories.append(category[1])
+        for line in rows:
+            label = _category_label(line, col_count)
+            if label is not None:
+                category = line, label
+                categories.append(label)
+        last_row = first_row + len(rows) - 1
+        yield page, first_row, last_row, bool(carried), categories
+        first_row = last_row + 1
+
+def _category_label(line, col_count):
+    """The first cell of a category row's line, stripped, or None for any other line."""
+    row = fit_row(parse_md_row(line), col_count)
+    return row[0].strip() if _is_category_row(row) else None
+
+def _numbered_page(html_file, number):
+    return html_file.with_name(f'{html_file.stem}-{number:04d}{html_file.suffix}')
+
+def _page_nav(html_file, number, more, label):
+    """Markup linking page number of a paginated table to its neighbours and the index."""
+    def link(target, text, rel):
+        return f'<a href="{html.escape(quote(target.name))}" rel="{rel}">{text}</a>'
+
+    previous = (link(_numbered_page(html_file, number - 1), '‹ Previous', 'prev') if number > 1
+                else '<span class="disabled">‹ Previous</span>')
+    following = (link(_numbered_page(html_file, number + 1), 'Next ›', 'next') if more
+                 else '<span class="disabled">Next ›</span>')
+    index = link(html_file, f'Page {number}', 'index')
+    return (f'<nav class="page-nav">{previous}<span>{index} · {html.escape(label)}</span>'
+            f'{following}</nav>').encode('utf-8')
+
+def _render_index_cell(text):
+    """Render a cell of a pagination index, with links that open in the same tab like the page navigation."""
+    return process_cell_content(text).replace(' target="_blank">', '>')
+
+def _write_page_index(html_file, md_file, pdf_title, contents, options):
+    """Write the index page of a paginated table: one row per page, with its rows and categories."""
+    lines = []
+    for page, first_row, last_row, categories in contents:
+        shown = ', '.join(categories[:_INDEX_CATEGORIES]) + (', …' if len(categories) > _INDEX_CATEGORIES else '')
+        lines.append(f'| [{page.stem}]({quote(page.name)}) | {first_row:,}–{last_row:,} | {shown} |')
+    index_table = MarkdownTable(0, 1, None)
+    index_table.lines = iter(lines)
+    index_options = copy.copy(options.for_page(html_file))
+    index_options.virtual = index_options.search_index = False
+    output = _page_output(html_file, index_options)
+    with closing(output):
+        _write_table_page(output, md_file, pdf_title, index_table, '| Page | Rows | Categories |',
+                          '|---|---|---|', _render_index_cell, index_options, _RowTally())
+    if options.compress:
+        output.report()
+
+def _write_tables_page(out, md_file, pdf_title, tables, render_cell, options, tally, page=True, profile=None):
+    """Write one page holding each (table, header_line, separator_line); return the tables.
+
+    Without page, only the table sections are written.
+    """
+    sources = []
+
+    with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+        def write_sections(out):
+            for number, (table, header_line, separator_line) in enumerate(tables, 1):
+                table_id = f'markdown-table-{number}'
+                out.write(f'<section class="table-section" id="table-{number}">'.encode('utf-8'))
+                if table.heading:
+                    out.write(f'<h2 class="table-heading">{render_cell(table.heading)}</h2>'.encode('utf-8'))
+                start, end = _write_table(out, header_line, separator_line, tally.track(table.lines),
+                                          table_id, render_cell, spool, options, profile)
+                out.write(b'</section>')
+                sources.append((table_id, table, start, end))
+
+        if not page:
+            write_sections(out)
+            return [table for _, table, _, _ in sources]
+        _write_page(out, {
+            'md_file': html.escape(md_file).encode('utf-8'),
+            'pdf_title': html.escape(pdf_title).encode('utf-8'),
+            'table': write_sections,
+            'page_nav': b'',
+            'original_md': _original_md_writer(spool, sources),
+            **_asset_fields(options),
+        })
+    return [table for _, table, _, _ in sources]
+
+def _write_table_page(out, md_file, pdf_title, table, header_line, separator_line, render_cell, options,
+                      tally, page=True, profile=None, page_nav=b''):
+    """Write the page for a single table, or without page only the table itself.
+
+    page_nav is markup placed above and below the table (see _page_nav).
+    """
+    # The original markdown is embedded after the table, so it is
+    # spooled while the rows stream through.
+    sources = []
+    with SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+        def write_table(out):
+            start, end = _write_table(out, header_line, separator_line, tally.track(table.lines),
+                                      'markdown-table', render_cell, spool, options, profile)
+            sources.append(('markdown-table', None, start, end))
+
+        if not page:
+            write_table(out)
+            return
+        _write_page(out, {
+            'md_file': html.escape(md_file).encode('utf-8'),
+            'pdf_title': html.escape(pdf_title).encode('utf-8'),
+            'table': write_table,
+            'page_nav': page_nav,
+            'original_md': _original_md_writer(spool, sources),
+            **_asset_fields(options),
+        })
+
+class _RowTally:
+    """Count the body rows of a page's tables, passing the running total to progress."""
+
+    def __init__(self, progress=None):
+        self.rows = 0
+        self.table_rows = 0
+        self.progress = progress
+
+    def track(self, lines):
+        """Return a table's body lines, counted as they are read."""
+        self.rows += self.table_rows
+        self.table_rows = 0
+        return _report_progress(lines, self.update)
+
+    def update(self, table_rows):
+        self.table_rows = table_rows
+        if self.progress is not None:
+            self.progress(self.total)
+
+    @property
+    def total(self):
+        return self.rows + self.table_rows
+
+# Stages timed by ConversionProfile, in pipeline order
+PROFILE_STAGES = ('read', 'detect', 'parse', 'category', 'columns', 'render', 'index', 'template', 'write')
+
+class ConversionProfile:
+    """Time, calls and bytes per conversion stage, collected across conversions.
+
+    Pass one as a converter's profile argument. The stages are:
+
+        read      reading input lines
+        detect    finding tables and their lines
+        parse     parse_md_row
+        category  category row detection
+        columns   column type inference (typed columns)
+        render    the cell renderer
+        index     search indexing
+        template  everything else: page template, row markup, embedded data
+        write     writing the output
+
+    The stages run interleaved as each pulls from the one before, and time
+    is charged to the innermost running stage only, so the stage times add
+    up to the total (less any time spent in hooks). Each hook is called as
+    hook(stage, seconds) after every timed call (once per cell for render),
+    so hooks should be cheap. Timing each call adds overhead of its own,
+    mostly to parse and render.
+    """
+
+    def __init__(self, hooks=()):
+        self.hooks = list(hooks)
+        self.seconds = dict.fromkeys(PROFILE_STAGES, 0.0)
+        self.calls = dict.fromkeys(PROFILE_STAGES, 0)
+        self.bytes = dict.fromkeys(PROFILE_STAGES, 0)
+        self.total_seconds = 0.0
+        self.rows = 0
+        self.tables = 0
+        self._stack = []  # [stage, seconds so far] for each running stage
+        self._mark = 0.0
+
+    def enter(self, stage):
+        now = time.perf_counter()
+        if self._stack:
+            self._stack[-1][1] += now - self._mark
+        self._stack.append([stage, 0.0])
+        self._mark = now
+
+    def leave(self):
+        now = time.perf_counter()
+        stage, seconds = self._stack.pop()
+        seconds += now - self._mark
+        self.seconds[stage] += seconds
+        self.calls[stage] += 1
+        if self.hooks:
+            for hook in self.hooks:
+                hook(stage, seconds)
+            # Time spent in the hooks is not charged to any stage
+            now = time.perf_counter()
+        self._mark = now
+
+    @contextmanager
+    def running(self):
+        """Time one conversion; whatever no other stage claims counts as template."""
+        start = time.perf_counter()
+        self.enter('template')
+        try:
+            yield self
+        finally:
+            self.leave()
+            self.total_seconds += time.perf_counter() - start
+
+    def wrap(self, stage, func):
+        """Return func timed as stage."""
+        def timed(*args):
+            self.enter(stage)
+            try:
+                return func(*args)
+            finally:
+                self.leave()
+        return timed
+
+    def iterate(self, stage, iterable):
+        """Yield the items of iterable, timing each step as stage."""
+        iterator = iter(iterable)
+        try:
+            while True:
+                self.enter(stage)
+                try:
+                    item = next(iterator, _END)
+                finally:
+                    self.leave()
+                if item is _END:
+                    return
+                yield item
+        finally:
+            if hasattr(iterator, 'close'):
+                iterator.close()
+
+    def read(self, lines):
+        """Yield the input lines, timed and counted as read."""
+        for line in self.iterate('read', lines):
+            self.bytes['read'] += len(line.encode('utf-8')) + 1
+            yield line
+
+    def read_tables(self, tables):
+        """Yield located tables, with the reading of their lines timed and counted as read."""
+        with closing(tables):
+            for table in tables:
+                table.lines = self.read(table.lines)
+                yield table
+
+    def to_dict(self):
+        """The profile as JSON-ready data; stages that never ran are left out."""
+        return {
+            'total_seconds': self.total_seconds,
+            'rows': self.rows,
+            'tables': self.tables,
+            'bytes_read': self.bytes['read'],
+            'bytes_written': self.bytes['write'],
+            'stages': {stage: {'seconds': self.seconds[stage], 'calls': self.calls[stage],
+                               'bytes': self.bytes[stage]}
+                       for stage in PROFILE_STAGES if self.calls[stage]},
+        }
+
+    def report(self, file=None):
+        """Print a table of the stage timings."""
+        file = file or sys.stdout
+        total = self.total_seconds or 1.0
+        print(f"{'Stage':<10} {'Time':>11} {'Share':>7} {'Calls':>10} {'Bytes':>12}", file=file)
+        for stage, data in self.to_dict()['stages'].items():
+            size = f"{data['bytes']:,}" if data['bytes'] else ''
+            print(f"{stage:<10} {data['seconds'] * 1000:8.1f} ms {data['seconds'] / total:7.1%} "
+                  f"{data['calls']:>10,} {size:>12}", file=file)
+        print(f"{'total':<10} {self.total_seconds * 1000:8.1f} ms  {self.rows:,} rows in {self.tables} table(s), "
+              f"{self.bytes['read']:,} bytes in, {self.bytes['write']:,} bytes out", file=file)
+
+_END = object()
+
+class _ProfiledOutput:
+    """A binary output whose writes are timed and counted as the write stage."""
+
+    def __init__(self, out, profile):
+        self.out = out
+        self.profile = profile
+
+    def write(self, data):
+        self.profile.enter('write')
+        try:
+            self.profile.bytes['write'] += len(data)
+            return self.out.write(data)
+        finally:
+            self.profile.leave()
+
+# Library API: convert Markdown held in memory, without touching the filesystem
+
+class ConversionError(Exception):
+    """Why a Markdown input could not be converted.
+
+    code is 'no_table' or 'no_separator' for the input, or 'not_found' for a
+    missing input file; str() gives the message the CLI prints.
+    """
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+# The outcome of a conversion. error is a ConversionError when ok is false.
+# tables lists the MarkdownTables written and rows counts their body rows;
+# html holds the page for convert_to_string and is None otherwise.
+ConversionResult = namedtuple('ConversionResult', 'ok error tables rows html')
+
+_NO_TABLE_MESSAGE = "No table found in the Markdown file."
+
+def _failed(code, message):
+    return ConversionResult(False, ConversionError(code, message), [], 0, None)
+
+def _source_lines(source):
+    """Lines of source, a Markdown string or an iterable of lines, without line endings."""
+    if isinstance(source, str):
+        # Universal newlines, as when reading a file
+        source = io.StringIO(source, newline=None)
+    return (line.rstrip('\n') for line in source)
+
+class _TextOutput:
+    """Adapt a text stream to the UTF-8 bytes the page writers produce."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.decode = codecs.getincrementaldecoder('utf-8')().decode
+
+    def write(self, data):
+        return self.stream.write(self.decode(data))
+
+def convert_to_stream(source, out, name='table.md', render_cell=process_cell_content, options=None,
+                      progress=None, page=True, profile=None):
+    """Write the viewer page for the Markdown in source to the stream out.
+
+    source is the Markdown as a string or as an iterable of lines; out is a
+    binary stream, or a text stream that is written str. name stands in for
+    the input file name in the page title and PDF export. options.tables may
+    be None (first table) or 'all'; one page cannot hold 'split' output.
+    render_cell, progress and profile work as in
+    convert_markdown_table_to_html. Without page, only the table markup is
+    written, for embedding in another page.
+
+    Returns a ConversionResult. Input without a table is reported in it, and
+    nothing is written to out.
+    """
+    options = options or DEFAULT_OPTIONS
+    if options.tables == 'split':
+        raise ValueError("split tables produce several pages; use convert_markdown_tables_to_html")
+    if isinstance(out, io.TextIOBase):
+        out = _TextOutput(out)
+    return _convert(_source_lines(source), out, name, render_cell, options, progress,
+                    all_tables=options.tables == 'all', page=page, profile=profile)
+
+def convert_to_string(source, name='table.md', render_cell=process_cell_content, options=None,
+                      progress=None, page=True, profile=None):
+    """Return a ConversionResult whose html is the viewer page for source.
+
+    Arguments are as for convert_to_stream.
+    """
+    out = io.BytesIO()
+    result = convert_to_stream(source, out, name, render_cell, options, progress, page, profile)
+    if not result.ok:
+        return result
+    return result._replace(html=out.getvalue().decode('utf-8'))
+
+def _convert(lines, out, md_file, render_cell, options, progress, all_tables, page=True, profile=None,
+             tables=None):
+    """Convert the first table in lines, or every complete one with all_tables, into a page on out.
+
+    tables, if given, are the MarkdownTables already located (see
+    iter_mapped_tables), and lines is not used.
+    """
+    if profile is None:
+        return _convert_tables(lines, out, md_file, render_cell, options, progress, all_tables, page,
+                               tables=tables)
+    if tables is None:
+        lines = profile.read(lines)
+    else:
+        tables = profile.read_tables(tables)
+    with profile.running():
+        result = _convert_tables(lines, _ProfiledOutput(out, profile), md_file,
+                                 profile.wrap('render', render_cell), options, progress, all_tables,
+                                 page, profile, tables)
+    profile.rows += result.rows
+    profile.tables += len(result.tables)
+    return result
+
+def _convert_tables(lines, out, md_file, render_cell, options, progress, all_tables, page, profile=None,
+                    tables=None):
+    options = options or DEFAULT_OPTIONS
     pdf_title = os.path.splitext(os.path.basename(md_file))[0]
+    tally = _RowTally(progress)
+    if tables is None:
+        tables = iter_markdown_tables(lines)
+    if profile is not None:
+        tables = profile.iterate('detect', tables)
+    with closing(tables):
+        if all_tables:
+            tables = _iter_complete_tables(tables)
+            first = next(tables, None)
+            if first is None:
+                return _failed('no_table', _NO_TABLE_MESSAGE)
+            written = _write_tables_page(out, md_file, pdf_title, chain([first], tables),
+                                         render_cell, options, tally, page, profile)
+            return ConversionResult(True, None, written, tally.total, None)
+
+        table = next(tables, None)
+        if table is None:
+            return _failed('no_table', _NO_TABLE_MESSAGE)
+        header_line = next(table.lines)
+        separator_line = next(table.lines, None)
+        if separator_line is None:
+            return _failed('no_separator', "Table must have at least header and separator.")
+        _write_table_page(out, md_file, pdf_title, table, header_line, separator_line,
+                          render_cell, options, tally, page, profile)
+        return ConversionResult(True, None, [table], tally.total, None)
+
+# The viewer page. Fields in braces are filled per conversion; the rest is
+# split into static byte segments once per process by _page_segments().
+_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Modern Markdown Table Viewer | {md_file}</title>
+    {icon_assets}
+    {viewer_css}
+</head>
+<body data-density="compact" data-pdf-title="{pdf_title}"> <!-- DEFAULT COMPACT VIEW -->
+    <div id="spinner" style="display:none; position:fixed; inset:0; background:rgba(255,255,255,0.7); z-index:2000; justify-content:center; align-items:center;">
+        <div style="border: 4px solid rgba(0,0,0,0.1); border-top: 4px solid var(--primary); border-radius: 50%; width: 40px; height: 40px; animation: spin 1s linear infinite;"></div>
+    </div>
+    <style>
+    @keyframes spin {{
+        0% {{ transform: rotate(0deg); }}
+        100% {{ transform: rotate(360deg); }}
+    }}
+    </style>
+    <div class="container">
+        <main>
+            <div class="header">
+                <h1>Markdown Table Viewer</h1>
+            </div>
+            <div class="card">
+                <div class="sentinel"></div>
+                <div class="sticky-header"> <!-- Sticky header element -->
 
-    # Build HTML
-    html_table = ['<div class="table-container">', '<table id="markdown-table">']
+                    <div class="header-bg-layer"></div>
+                
+                    <div class="search-box">
+                        <i class="fas fa-search"></i>
+                        <input type="text" id="tableSearch" placeholder="Search table content...">
+                    </div>
 
-    # Header
-    html_table.append('<thead><tr>')
-    for cell in header:
-        processed_cell = process_cell_content(cell)
-        html_table.append(f'<th>{processed_cell}</th>')
-    html_table.append('</tr></thead>')
+                    <div class="status-bar">
+                        <div class="stats">
+                            <span id="rowCount">0 rows</span> • 
+                            <span id="visibleCount">0 visible</span>
+                        </div>
+                    </div>
 
-    html_table.append('<tbody>')
+                    <div class="file-info">
+                        <i class="fas fa-file-alt"></i>
+                        <span>Converted from: {md_file}</span>
+                    </div>
 
-    current_category = ''
-    for row in normalized_rows:
-        first, rest = row[0], row[1:]
+                    <button class="theme-toggle" id="themeToggle">
+                        <i class="fas fa-moon"></i>
+                    </button>
 
-        # Detect category row: only first column has text
-        if first.strip() and all(cell.strip() == '' for cell in rest):
-            current_category = first
-            processed_category = process_cell_content(current_category)
-            html_table.append(f'<tr class="category-row"><td colspan="{len(row)}">{processed_category}</td></tr>')
-            continue
+                    <button class="density-toggle" id="densityToggle">
+                        <i class="fas fa-expand-alt"></i> <!-- Changed to expand icon -->
+                    </button>
+                </div>
+                {page_nav}
+                <div class="table-container">
+                    {table}
+                </div>
+                {page_nav}
+            </div>
+        </main>
 
-        # This is a data row
-        html_table.append('<tr>')
-        for cell in row:
-            processed_cell = process_cell_content(cell)
-            html_table.append(f'<td>{processed_cell}</td>')
-        html_table.append('</tr>')
+        <footer>
+            <p>Modern Markdown Table Viewer • Created by Cem Çakmak</p>
+            <p>Converted from: {md_file} • <a href="#" id="timestamp"></a></p>
+        </footer>
+    </div>
 
-    html_table.append('</tbody></table></div>')
+    <div class="export-menu">
+        <div class="export-options" id="exportOptions">
+            <button onclick="exportToCSV()">
+                <i class="fas fa-file-csv"></i> Export as CSV
+            </button>
+            <button onclick="exportToPDF()">
+                <i class="fas fa-file-pdf"></i> Export as PDF
+            </button>
+            <button onclick="copyToClipboard()">
+                <i class="fas fa-copy"></i> Copy as HTML
+            </button>
+        </div>
+        <button class="export-btn" onclick="toggleExportMenu()">
+            <i class="fas fa-download"></i>
+        </button>
+    </div>
 
-    # Generate modern HTML output
-    html_output = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Modern Markdown Table Viewer | {md_file}</title>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <style>
-        :root {{
+    <!-- Libraries -->
+    {script_assets}
+
+    {viewer_js}
+    {original_md}
+</body>
+</html>
+"""
+
+# The viewer's stylesheet and script. Pages embed them, or link the shared
+# copies written by write_shared_assets.
+_VIEWER_CSS = """\
+        :root {
             /* hsl (fallback color) */
             --bg-dark: hsl(204 68% 90%);
             --bg: hsl(204 100% 95%);
@@ -186,9 +1990,9 @@ def convert_markdown_table_to_html(md_file, html_file):
             --card-border-muted: 1px solid var(--border-muted);
 
             --transition: all 0.8s cubic-bezier(0.68, -0.55, 0.27, 1.55);
-        }}
+        }
 
-        [data-theme="dark"] {{
+        [data-theme="dark"] {
               /* hsl (fallback color) */
             --bg-dark: hsl(215 100% 2%);
             --bg: hsl(206 93% 4%);
@@ -244,15 +2048,15 @@ def convert_markdown_table_to_html(md_file, html_file):
             --inset-shadow-dark:
                 inset 2px 2px 4px rgba(0, 0, 0, 0.5),
                 inset -2px -2px 4px rgba(255, 255, 255, 0.06);
-        }}
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Inter', 'Segoe UI', system-ui, -apple-system, sans-serif;
             background: var(--bg-dark);
             color: var(--text);
@@ -260,28 +2064,28 @@ def convert_markdown_table_to_html(md_file, html_file):
             min-height: 100vh;
             padding: 2rem 1rem;
             transition: var(--transition);
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 95%;
             margin: 0 auto;
             margin-top: 2rem;
-        }}
+        }
 
-        .header {{
+        .header {
             text-align: center;
             margin: 2rem 0 3rem;
             padding: 0 1rem;
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             font-size: 2.8rem;
             font-weight: 800;
             color: var(--primary);
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .card {{
+        .card {
             background: var(--bg);
             box-shadow: var(--box-shadow-subtle);
             border-radius: 50px;
@@ -290,9 +2094,9 @@ def convert_markdown_table_to_html(md_file, html_file):
             transition: var(--transition);
             position: relative;
             justify-content: center;
-        }}
+        }
 
-        .sticky-header {{
+        .sticky-header {
             position: sticky;
             top: 0;
             margin-left: auto;
@@ -306,9 +2110,9 @@ def convert_markdown_table_to_html(md_file, html_file):
             align-items: center;
             transition: var(--transition);
             overflow: hidden;
-        }}
+        }
 
-        .sticky-header.stuck {{
+        .sticky-header.stuck {
             width: 90%;
             box-shadow: var(--box-shadow-elevated);
             background: transparent;
@@ -316,9 +2120,9 @@ def convert_markdown_table_to_html(md_file, html_file):
             border-radius: 50px;
             top: 2rem;
             z-index: 1;
-        }}
+        }
 
-        .header-bg-layer {{
+        .header-bg-layer {
             position: absolute;
             top: 0;
             left: 0;
@@ -328,20 +2132,20 @@ def convert_markdown_table_to_html(md_file, html_file):
             background: var(--bg-header);
             pointer-events: none;
             backdrop-filter: blur(6px);
-        }}
+        }
 
-        .sticky-header > *:not(.header-bg-layer) {{
+        .sticky-header > *:not(.header-bg-layer) {
             z-index: 2;
-        }}
+        }
 
-        .search-box {{
+        .search-box {
             position: relative;
             color: var(--text-muted);
             height: 3rem;
             flex: 1;
-        }}
+        }
 
-        .search-box input {{
+        .search-box input {
             width: 100%;
             height: 100%;
             padding: 0.8rem 1rem 0.8rem 2.5rem;
@@ -352,24 +2156,24 @@ def convert_markdown_table_to_html(md_file, html_file):
             color: var(--text);
             font-size: 0.95rem;
             transition: var(--transition);
-        }}
+        }
 
-        .search-box input:focus {{
+        .search-box input:focus {
             outline: none;
             border-color: var(--primary);
             box-shadow: var(--box-shadow-elevated) !important;
             transform: scale(1.05);
-        }}
+        }
 
-        .search-box i {{
+        .search-box i {
             position: absolute;
             left: 1rem;
             top: 50%;
             transform: translateY(-50%);
             color: var(--text-muted);
-        }}
+        }
 
-        .status-bar {{
+        .status-bar {
             height: 3rem;
             display: flex;
             justify-content: space-between;
@@ -380,14 +2184,14 @@ def convert_markdown_table_to_html(md_file, html_file):
             font-size: 0.9rem;
             color: var(--text-muted);
             border: var(--card-border-muted);
-        }}
+        }
 
-        .status-bar .actions {{
+        .status-bar .actions {
             display: flex;
             gap: 0.8rem;
-        }}
+        }
 
-        .file-info {{
+        .file-info {
             background: var(--bg-header-element);
             border-radius: 40px;
             padding: 1rem 2rem;
@@ -401,14 +2205,14 @@ def convert_markdown_table_to_html(md_file, html_file):
             border: var(--card-border-muted);
             height: 3rem;
             flex: 1;
-        }}
+        }
 
-        .file-info i {{
+        .file-info i {
             font-size: 1.2rem;
             color: var(--text-muted);
-        }}
+        }
 
-        .theme-toggle, .density-toggle {{
+        .theme-toggle, .density-toggle {
             width: 3rem;
             height: 3rem;
             border-radius: 50%;
@@ -421,28 +2225,58 @@ def convert_markdown_table_to_html(md_file, html_file):
             border: var(--card-border-muted);
             cursor: pointer;
             transition: var(--transition);
-        }}
+        }
 
-        .theme-toggle:hover, .density-toggle:hover {{
+        .theme-toggle:hover, .density-toggle:hover {
             box-shadow: var(--box-shadow-subtle);
             transform: translateY(-2px);
             border-color: var(--primary);
-        }}
+        }
 
-        .table-container {{
+        .table-container {
             overflow-x: auto;
-        }}
+        }
+
+        .table-section + .table-section {
+            margin-top: 2rem;
+        }
+
+        .table-heading {
+            margin: 1rem 0 0.8rem;
+            font-size: 1.2rem;
+            color: var(--text);
+        }
 
-        table {{
+        .page-nav {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            gap: 1rem;
+            margin: 1rem 0;
+            color: var(--text-muted);
+            font-size: 0.95rem;
+        }
+
+        .page-nav a {
+            color: var(--primary);
+            text-decoration: none;
+            font-weight: 500;
+        }
+
+        .page-nav .disabled {
+            visibility: hidden;
+        }
+
+        table {
             width: 100%;
             border-collapse: separate;
             border-spacing: 0;
             min-width: 600px;
             table-layout: fixed;
             background: transparent;
-        }}
+        }
 
-        .column-grip {{
+        .column-grip {
             position: absolute;
             right: 0;
             top: 0;
@@ -456,18 +2290,18 @@ def convert_markdown_table_to_html(md_file, html_file):
             transition: opacity 0.2s;
             font-size: 12px;
             color: var(--text-muted);
-        }}
+        }
 
-        th:hover .column-grip {{
+        th:hover .column-grip {
             opacity: 1;
-        }}
+        }
 
-        table.resizing {{
+        table.resizing {
             cursor: col-resize;
             user-select: none;
-        }}
+        }
 
-        th, td {{
+        th, td {
             border-left: var(--card-border-muted);
             border-right: var(--card-border-muted);
             border-bottom: var(--card-border-muted);
@@ -476,21 +2310,31 @@ def convert_markdown_table_to_html(md_file, html_file):
             overflow-wrap: break-word;
             background: transparent;
             z-index: 0;
-        }}
+        }
+
+        td.num, th.num {
+            text-align: right;
+            font-variant-numeric: tabular-nums;
+        }
+
+        tfoot td {
+            font-weight: 600;
+            border-top: var(--card-border);
+        }
 
-        thead tr:first-child th {{
+        thead tr:first-child th {
             border-top: var(--card-border-muted);
-        }}
+        }
 
-        th:first-child, td:first-child {{
+        th:first-child, td:first-child {
             border-left: none;
-        }}
+        }
 
-        th:last-child, td:last-child {{
+        th:last-child, td:last-child {
             border-right: none;
-        }}
+        }
 
-        th {{
+        th {
             background: var(--bg-dark);
             color: var(--text);
             font-weight: 600;
@@ -498,42 +2342,48 @@ def convert_markdown_table_to_html(md_file, html_file):
             border-bottom: var(--card-border);
             position: sticky;
             top: 0;
-        }}
+        }
 
-        tbody tr:nth-child(even) td {{
+        tbody tr:nth-child(even) td {
             background: var(--bg-light);
-        }}
+        }
 
-        tbody tr:hover td {{
+        tbody tr:hover td {
             background: var(--highlight) !important;
-        }}
+        }
+
+        tbody tr.virtual-spacer td {
+            padding: 0;
+            border: 0;
+            background: transparent !important;
+        }
 
         body[data-density="compact"] th,
-        body[data-density="compact"] td {{
+        body[data-density="compact"] td {
             padding: 0.5rem 0.8rem;
             font-size: 0.8rem;
             line-height: 1.4;
-        }}
+        }
 
-        footer {{
+        footer {
             text-align: center;
             margin-top: 2rem;
             color: var(--text);
             font-size: 0.9rem;
             padding: 1.5rem 0;
-        }}
+        }
 
-        footer a {{
+        footer a {
             color: var(--primary);
             text-decoration: none;
             font-weight: 500;
-        }}
+        }
 
-        footer a:hover {{
+        footer a:hover {
             text-decoration: underline;
-        }}
+        }
 
-        .export-menu {{
+        .export-menu {
             position: fixed;
             bottom: 35px;
             right: 35px;
@@ -541,9 +2391,9 @@ def convert_markdown_table_to_html(md_file, html_file):
             flex-direction: column;
             gap: 20px;
             z-index: 100;
-        }}
+        }
 
-        .export-btn {{
+        .export-btn {
             width: 4rem;
             height: 4rem;
             border-radius: 50%;
@@ -556,14 +2406,14 @@ def convert_markdown_table_to_html(md_file, html_file):
             box-shadow: var(--box-shadow);
             cursor: pointer;
             transition: var(--transition);
-        }}
+        }
 
-        .export-btn:hover {{
+        .export-btn:hover {
             transform: translateY(-5px) scale(1.05);
             box-shadow: var(--box-shadow-elevated);
-        }}
+        }
 
-        .export-options {{
+        .export-options {
             position: absolute;
             bottom: 75px;
             right: 0;
@@ -581,9 +2431,9 @@ def convert_markdown_table_to_html(md_file, html_file):
             transition: var(--transition);
             animation: scaleIn 0.3s ease-out forwards;
             z-index: 101;
-        }}
+        }
 
-        .export-options button {{
+        .export-options button {
             display: flex;
             align-items: center;
             gap: 12px;
@@ -597,133 +2447,60 @@ def convert_markdown_table_to_html(md_file, html_file):
             transition: var(--transition);
             font-size: 1rem;
             font-weight: 500;
-        }}
+        }
 
-        .export-options button:hover {{
+        .export-options button:hover {
             transition: none;
             background: var(--highlight);
-        }}
+        }
 
-        @keyframes scaleIn {{
-            from {{ transform: scale(0.8); opacity: 0; }}
-            to {{ transform: scale(1); opacity: 1; }}
-        }}
+        @keyframes scaleIn {
+            from { transform: scale(0.8); opacity: 0; }
+            to { transform: scale(1); opacity: 1; }
+        }
 
-        @media (max-width: 768px) {{
-            .sticky-header {{
+        @media (max-width: 768px) {
+            .sticky-header {
                 flex-wrap: wrap;
                 padding: 1rem;
-            }}
+            }
             
-            .search-box, .file-info {{
+            .search-box, .file-info {
                 width: 100%;
                 margin-bottom: 0.5rem;
-            }}
+            }
             
-            .filters {{
+            .filters {
                 flex-direction: column;
                 gap: 0.8rem;
-            }}
+            }
             
-            .status-bar {{
+            .status-bar {
                 flex-direction: column;
                 gap: 0.8rem;
                 align-items: center;
                 text-align: center;
-            }}
+            }
             
-            .export-menu {{
+            .export-menu {
                 bottom: 20px;
                 right: 20px;
-            }}
+            }
             
-            .export-btn {{
+            .export-btn {
                 width: 3.5rem;
                 height: 3.5rem;
-            }}
-        }}
-    </style>
-</head>
-<body data-density="compact"> <!-- DEFAULT COMPACT VIEW -->
-    <div id="spinner" style="display:none; position:fixed; inset:0; background:rgba(255,255,255,0.7); z-index:2000; justify-content:center; align-items:center;">
-        <div style="border: 4px solid rgba(0,0,0,0.1); border-top: 4px solid var(--primary); border-radius: 50%; width: 40px; height: 40px; animation: spin 1s linear infinite;"></div>
-    </div>
-    <style>
-    @keyframes spin {{
-        0% {{ transform: rotate(0deg); }}
-        100% {{ transform: rotate(360deg); }}
-    }}
-    </style>
-    <div class="container">
-        <main>
-            <div class="header">
-                <h1>Markdown Table Viewer</h1>
-            </div>
-            <div class="card">
-                <div class="sentinel"></div>
-                <div class="sticky-header"> <!-- Sticky header element -->
-
-                    <div class="header-bg-layer"></div>
-                
-                    <div class="search-box">
-                        <i class="fas fa-search"></i>
-                        <input type="text" id="tableSearch" placeholder="Search table content...">
-                    </div>
-
-                    <div class="status-bar">
-                        <div class="stats">
-                            <span id="rowCount">0 rows</span> • 
-                            <span id="visibleCount">0 visible</span>
-                        </div>
-                    </div>
-
-                    <div class="file-info">
-                        <i class="fas fa-file-alt"></i>
-                        <span>Converted from: {md_file}</span>
-                    </div>
-
-                    <button class="theme-toggle" id="themeToggle">
-                        <i class="fas fa-moon"></i>
-                    </button>
-
-                    <button class="density-toggle" id="densityToggle">
-                        <i class="fas fa-expand-alt"></i> <!-- Changed to expand icon -->
-                    </button>
-                </div>
-                <div class="table-container">
-                    {''.join(html_table)}
-                </div>
-            </div>
-        </main>
-
-        <footer>
-            <p>Modern Markdown Table Viewer • Created by Cem Çakmak</p>
-            <p>Converted from: {md_file} • <a href="#" id="timestamp"></a></p>
-        </footer>
-    </div>
-
-    <div class="export-menu">
-        <div class="export-options" id="exportOptions">
-            <button onclick="exportToCSV()">
-                <i class="fas fa-file-csv"></i> Export as CSV
-            </button>
-            <button onclick="exportToPDF()">
-                <i class="fas fa-file-pdf"></i> Export as PDF
-            </button>
-            <button onclick="copyToClipboard()">
-                <i class="fas fa-copy"></i> Copy as HTML
-            </button>
-        </div>
-        <button class="export-btn" onclick="toggleExportMenu()">
-            <i class="fas fa-download"></i>
-        </button>
-    </div>
-
-    <!-- Libraries -->
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/jspdf/2.5.1/jspdf.umd.min.js"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/jspdf-autotable/3.5.28/jspdf.plugin.autotable.min.js"></script>
+            }
+        }
+
+        @media print {
+            .sticky-header, .export-menu, footer {
+                display: none;
+            }
+        }
+"""
 
-    <script>
+_VIEWER_JS = """\
         // Theme and Density toggle
         const themeToggle = document.getElementById('themeToggle');
         const densityToggle = document.getElementById('densityToggle');
@@ -732,211 +2509,373 @@ def convert_markdown_table_to_html(md_file, html_file):
         
         // Check for saved theme preference
         const savedTheme = localStorage.getItem('theme');
-        if (savedTheme) {{
+        if (savedTheme) {
             html.setAttribute('data-theme', savedTheme);
             updateThemeIcon(savedTheme);
-        }}
+        }
         
-        themeToggle.addEventListener('click', () => {{
+        themeToggle.addEventListener('click', () => {
             const currentTheme = html.getAttribute('data-theme');
             const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
             html.setAttribute('data-theme', newTheme);
             localStorage.setItem('theme', newTheme);
             updateThemeIcon(newTheme);
-        }});
+        });
 
-        densityToggle.addEventListener('click', () => {{
+        densityToggle.addEventListener('click', () => {
             const compact = body.getAttribute('data-density') === 'compact';
             body.setAttribute('data-density', compact ? 'normal' : 'compact');
             updateDensityIcon(compact ? 'normal' : 'compact');
-        }});
+        });
         
-        function updateThemeIcon(theme) {{
+        function updateThemeIcon(theme) {
             themeToggle.innerHTML = theme === 'dark' 
                 ? '<i class="fas fa-sun"></i>' 
                 : '<i class="fas fa-moon"></i>';
-        }}
+        }
         
-        function updateDensityIcon(density) {{
+        function updateDensityIcon(density) {
             densityToggle.innerHTML = density === 'compact'
                 ? '<i class="fas fa-expand-alt"></i>'
                 : '<i class="fas fa-compress-alt"></i>';
-        }}
+        }
         
         // Set current date in footer
         const now = new Date();
         document.getElementById('timestamp').textContent = now.toLocaleString();
 
         // Function to update status bar with row count and file size
-        function updateStatusBar() {{
-            try {{
-                const dataRows = document.querySelectorAll('#markdown-table tbody tr:not(.category-row)');
-                const rowCount = dataRows.length;
+        function updateStatusBar() {
+            try {
+                const dataRows = document.querySelectorAll('.markdown-table:not(.virtual-table) tbody tr:not(.category-row)');
+                let rowCount = dataRows.length;
+                virtualTables.forEach(state => {
+                    rowCount += state.dataRowCount;
+                });
                 
-                const rawMd = document.getElementById('original-md').textContent;
+                const rawMd = Array.from(document.querySelectorAll('.original-md'), source => source.textContent).join('\\n');
                 const fileSizeBytes = new Blob([rawMd]).size;
                 
-                function formatFileSize(bytes) {{
+                function formatFileSize(bytes) {
                     if (bytes < 1024) return bytes + ' bytes';
                     if (bytes < 1048576) return (bytes / 1024).toFixed(1) + ' KB';
                     return (bytes / 1048576).toFixed(1) + ' MB';
-                }}
+                }
                 
                 const fileSize = formatFileSize(fileSizeBytes);
                 
-                document.getElementById('rowCount').textContent = `${{rowCount}} Rows`;
+                document.getElementById('rowCount').textContent = `${rowCount} Rows`;
                 document.getElementById('visibleCount').textContent = fileSize;
                 
-            }} catch (e) {{
+            } catch (e) {
                 console.error('Error updating status bar:', e);
                 // Fallback display
                 document.getElementById('rowCount').textContent = 'N/A Rows';
                 document.getElementById('visibleCount').textContent = 'N/A';
-            }}
-        }}
-
-        // Initialize when page loads
-        document.addEventListener('DOMContentLoaded', function() {{
-            updateStatusBar();
-            
-            // Update when table changes (if needed)
-            const observer = new MutationObserver(updateStatusBar);
-            const tableContainer = document.querySelector('.table-container');
-            if (tableContainer) {{
-                observer.observe(tableContainer, {{ childList: true, subtree: true }});
-            }}
-
-            // Also update after search operations (if rows might be hidden)
-            document.getElementById('tableSearch')?.addEventListener('input', function() {{
-                setTimeout(updateStatusBar, 100);
-            }});
-        }});
+            }
+        }
+
+        // Initialize when page loads. The row count and size never change
+        // after export, so the status bar is filled in once.
+        document.addEventListener('DOMContentLoaded', updateStatusBar);
+
+        // Virtualized tables: rows are embedded as JSON and only the rows
+        // near the viewport are kept in the DOM
+        const virtualTables = Array.from(document.querySelectorAll('script.table-rows'), source => {
+            const rows = JSON.parse(source.textContent);
+            const isCategory = rows.map(row => row.startsWith('<tr class="category-row"'));
+            return {
+                table: document.getElementById(source.dataset.table),
+                rows,
+                isCategory,
+                dataRowCount: isCategory.filter(flag => !flag).length,
+                visible: rows,
+                texts: [],
+                rowHeight: 40,
+                start: -1,
+                end: -1
+            };
+        });
+
+        function renderVirtualRows(state) {
+            const { table, visible } = state;
+            const tbody = table.tBodies[0];
+            const colCount = table.tHead.rows[0].cells.length;
+            const overscan = 20;
+
+            const top = tbody.getBoundingClientRect().top;
+            let first = Math.max(0, Math.floor(-top / state.rowHeight) - overscan);
+            first -= first % 2; // Keep zebra striping stable while scrolling
+            const last = Math.min(visible.length, first + Math.ceil(window.innerHeight / state.rowHeight) + overscan * 2);
+            if (first === state.start && last === state.end) return;
+            state.start = first;
+            state.end = last;
+
+            const spacer = height => `<tr class="virtual-spacer" aria-hidden="true"><td colspan="${colCount}" style="height: ${height}px"></td></tr>`;
+            const before = first * state.rowHeight;
+            const after = (visible.length - last) * state.rowHeight;
+            // The empty row keeps the first rendered row at an odd position for nth-child striping
+            tbody.innerHTML = spacer(before) + '<tr class="virtual-spacer"></tr>' + visible.slice(first, last).join('') + spacer(after);
+
+            // Refine the row height estimate from the rows just rendered
+            const rendered = last - first;
+            if (rendered > 0) {
+                const measured = (tbody.offsetHeight - before - after) / rendered;
+                if (measured > 0 && Math.abs(measured - state.rowHeight) > 1) {
+                    state.rowHeight = measured;
+                    state.start = -1;
+                    requestAnimationFrame(() => renderVirtualRows(state));
+                }
+            }
+        }
+
+        // Lowercased cell texts of a virtual row, parsed on first use
+        const rowTemplate = document.createElement('template');
+        function rowCellTexts(state, index) {
+            let texts = state.texts[index];
+            if (!texts) {
+                rowTemplate.innerHTML = state.rows[index];
+                texts = Array.from(rowTemplate.content.querySelectorAll('td'), cell => cell.textContent.toLowerCase());
+                state.texts[index] = texts;
+            }
+            return texts;
+        }
+
+        function filterVirtualRows(state, searchTerm) {
+            if (!searchTerm) {
+                state.visible = state.rows;
+            } else {
+                const candidates = searchCandidates(state.table.id, searchTerm);
+                const matches = index => (!candidates || candidates.has(index))
+                    && rowCellTexts(state, index).some(text => text.includes(searchTerm));
+                // Category rows stay visible, as in regular tables
+                state.visible = state.rows.filter((row, index) => state.isCategory[index] || matches(index));
+            }
+            state.start = -1;
+            renderVirtualRows(state);
+        }
+
+        let virtualFrame = 0;
+        function scheduleVirtualRender() {
+            if (virtualFrame) return;
+            virtualFrame = requestAnimationFrame(() => {
+                virtualFrame = 0;
+                virtualTables.forEach(renderVirtualRows);
+            });
+        }
+
+        if (virtualTables.length) {
+            window.addEventListener('scroll', scheduleVirtualRender, { passive: true });
+            window.addEventListener('resize', scheduleVirtualRender);
+            virtualTables.forEach(renderVirtualRows);
+        }
+
+        // All rows of a table as <tr> elements, including rows of virtualized tables
+        function allTableRows(table) {
+            const state = virtualTables.find(entry => entry.table === table);
+            if (!state) return Array.from(table.querySelectorAll('tr'));
+            const tbody = document.createElement('tbody');
+            tbody.innerHTML = state.rows.join('');
+            return [...table.tHead.rows, ...tbody.rows, ...(table.tFoot ? table.tFoot.rows : [])];
+        }
+
+        // Prebuilt search indexes: trigram -> delta-encoded body row numbers
+        const searchIndexes = new Map(Array.from(document.querySelectorAll('script.search-index'), source => {
+            return [source.dataset.table, { ...JSON.parse(source.textContent), decoded: new Map() }];
+        }));
+
+        function indexRows(index, key) {
+            let rows = index.decoded.get(key);
+            if (!rows) {
+                rows = (index.postings[key] || []).slice();
+                for (let i = 1; i < rows.length; i++) rows[i] += rows[i - 1];
+                index.decoded.set(key, rows);
+            }
+            return rows;
+        }
+
+        // Rows of sorted list a that are also in sorted list b
+        function intersectRows(a, b) {
+            return a.filter(row => {
+                let low = 0, high = b.length;
+                while (low < high) {
+                    const mid = (low + high) >> 1;
+                    if (b[mid] < row) low = mid + 1; else high = mid;
+                }
+                return b[low] === row;
+            });
+        }
+
+        // Body rows that may contain searchTerm, or null if the table has no index
+        function searchCandidates(tableId, searchTerm) {
+            const index = searchIndexes.get(tableId);
+            if (!index) return null;
+            if (searchTerm.length < index.gram) {
+                const candidates = new Set();
+                for (const key in index.postings) {
+                    if (key.includes(searchTerm)) indexRows(index, key).forEach(row => candidates.add(row));
+                }
+                return candidates;
+            }
+            const lists = [];
+            for (let i = 0; i + index.gram <= searchTerm.length; i++) {
+                lists.push(indexRows(index, searchTerm.slice(i, i + index.gram)));
+            }
+            lists.sort((a, b) => a.length - b.length);
+            let rows = lists[0];
+            for (const list of lists.slice(1)) {
+                if (!rows.length) break;
+                rows = intersectRows(rows, list);
+            }
+            return new Set(rows);
+        }
 
         // Search functionality
         const searchInput = document.getElementById('tableSearch');
-        searchInput.addEventListener('input', function() {{
+        searchInput.addEventListener('input', function() {
             const searchTerm = this.value.toLowerCase();
-            const rows = document.querySelectorAll('#markdown-table tbody tr');
-            
-            rows.forEach(row => {{
-                // Skip category rows
-                if (row.classList.contains('category-row')) return;
-                
-                const cells = row.querySelectorAll('td');
-                let rowContainsText = false;
-                
-                cells.forEach(cell => {{
-                    if (cell.textContent.toLowerCase().includes(searchTerm)) {{
-                        rowContainsText = true;
-                    }}
-                }});
-                
-                row.style.display = rowContainsText ? '' : 'none';
-            }});
-        }});
+            virtualTables.forEach(state => filterVirtualRows(state, searchTerm));
+
+            document.querySelectorAll('.markdown-table:not(.virtual-table)').forEach(table => {
+                const candidates = searchTerm ? searchCandidates(table.id, searchTerm) : null;
+                Array.from(table.tBodies[0].rows).forEach((row, index) => {
+                    // Skip category rows
+                    if (row.classList.contains('category-row')) return;
+
+                    // Rows ruled out by the index are hidden without reading their text
+                    let rowContainsText = false;
+                    if (!candidates || candidates.has(index)) {
+                        const cells = row.querySelectorAll('td');
+                        cells.forEach(cell => {
+                            if (cell.textContent.toLowerCase().includes(searchTerm)) {
+                                rowContainsText = true;
+                            }
+                        });
+                    }
+
+                    const display = rowContainsText ? '' : 'none';
+                    if (row.style.display !== display) row.style.display = display;
+                });
+            });
+        });
+
+        // Setup the first paint does not need waits until the browser is idle
+        const whenIdle = window.requestIdleCallback || (callback => setTimeout(callback, 1));
 
         // Sticky header functionality
         const sentinel = document.querySelector('.sentinel');
         const sticky = document.querySelector('.sticky-header');
         const root = document.documentElement;
 
-        const observer = new IntersectionObserver(
-        ([entry]) => {{
-            sticky.classList.toggle('stuck', !entry.isIntersecting);
-        }},
-        {{ threshold: [1.0] }}
-        );
+        whenIdle(() => {
+            const observer = new IntersectionObserver(
+            ([entry]) => {
+                sticky.classList.toggle('stuck', !entry.isIntersecting);
+            },
+            { threshold: [1.0] }
+            );
 
-        observer.observe(sentinel);
+            observer.observe(sentinel);
+        });
 
         // Column resizing functionality
         let isResizing = false;
-        let currentColumn = null;
+        let currentHeader = null;
         let startX = 0;
         let startWidth = 0;
 
-        function initColumnResize() {{
-        const headers = document.querySelectorAll('#markdown-table th');
+        function initColumnResize() {
+        const headers = document.querySelectorAll('.markdown-table th');
         
-        headers.forEach((header, index) => {{
+        headers.forEach(header => {
             const grip = document.createElement('div');
             grip.classList.add('column-grip');
             grip.innerHTML = '↔';
             header.appendChild(grip);
             
-            grip.addEventListener('mousedown', (e) => {{
+            grip.addEventListener('mousedown', (e) => {
             isResizing = true;
-            currentColumn = index;
+            currentHeader = header;
             startX = e.clientX;
             startWidth = header.offsetWidth;
             document.body.style.cursor = 'col-resize';
             
             const table = header.closest('table');
             table.classList.add('resizing');
+
+            // Pointer tracking is only listened to during a drag
+            document.addEventListener('mousemove', resizeColumn);
+            document.addEventListener('mouseup', stopResize);
             
             e.preventDefault();
-            }});
-        }});
-        
-        document.addEventListener('mousemove', (e) => {{
+            });
+        });
+        }
+
+        function resizeColumn(e) {
             if (!isResizing) return;
             
-            const headers = document.querySelectorAll('#markdown-table th');
-            const header = headers[currentColumn];
             const width = startWidth + (e.clientX - startX);
+            const column = currentHeader.cellIndex + 1;
             
-            header.style.width = `${{width}}px`;
+            currentHeader.style.width = `${width}px`;
             
             // Apply to all cells in column
-            document.querySelectorAll(`#markdown-table tr > td:nth-child(${{currentColumn + 1}})`)
-            .forEach(cell => cell.style.width = `${{width}}px`);
-        }});
+            currentHeader.closest('table').querySelectorAll(`tr:not(.virtual-spacer) > td:nth-child(${column})`)
+            .forEach(cell => cell.style.width = `${width}px`);
+        }
         
-        document.addEventListener('mouseup', () => {{
-            if (isResizing) {{
+        function stopResize() {
+            document.removeEventListener('mousemove', resizeColumn);
+            document.removeEventListener('mouseup', stopResize);
+            if (isResizing) {
             isResizing = false;
             document.body.style.cursor = '';
-            document.querySelector('#markdown-table').classList.remove('resizing');
-            }}
-        }});
-        }}
+            currentHeader.closest('table').classList.remove('resizing');
+            }
+        }
 
-        initColumnResize();
+        whenIdle(initColumnResize);
 
-        // Export menu toggle
-        function toggleExportMenu() {{
+        // Export menu toggle. Opening it starts loading the PDF libraries,
+        // so they are usually ready by the time Export as PDF is clicked.
+        function toggleExportMenu() {
             const menu = document.getElementById('exportOptions');
             menu.style.display = menu.style.display === 'flex' ? 'none' : 'flex';
-        }}
+            if (menu.style.display === 'flex') loadPdfLibraries().catch(() => {});
+        }
         
         // Close export menu when clicking outside
-        document.addEventListener('click', (e) => {{
+        document.addEventListener('click', (e) => {
             const menu = document.getElementById('exportOptions');
             const exportBtn = document.querySelector('.export-btn');
             
             if (menu.style.display === 'flex' && 
                 !menu.contains(e.target) && 
-                !exportBtn.contains(e.target)) {{
+                !exportBtn.contains(e.target)) {
                 menu.style.display = 'none';
-            }}
-        }});
+            }
+        });
         
         // Export functions
-        function exportToCSV() {{
-            const rows = document.querySelectorAll('table tr');
+        function exportToCSV() {
             let csv = [];
             
-            for (const row of rows) {{
-                const cells = Array.from(row.querySelectorAll('th, td')).map(cell => {{
+            // Tables are separated by an empty line
+            document.querySelectorAll('.markdown-table').forEach((table, index) => {
+            if (index > 0) csv.push('');
+            for (const row of allTableRows(table)) {
+                const cells = Array.from(row.querySelectorAll('th, td')).map(cell => {
                     let text = cell.textContent.trim();
                     // Escape quotes
                     text = text.replace(/"/g, '""');
-                    return `"${{text}}"`;
-                }});
+                    return `"${text}"`;
+                });
                 csv.push(cells.join(','));
-            }}
+            }
+            });
             
-            const blob = new Blob([csv.join('\\n')], {{ type: 'text/csv' }});
+            const blob = new Blob([csv.join('\\n')], { type: 'text/csv' });
             const a = document.createElement('a');
             a.href = URL.createObjectURL(blob);
             a.download = 'table_export.csv';
@@ -945,9 +2884,9 @@ def convert_markdown_table_to_html(md_file, html_file):
             document.body.removeChild(a);
             
             showNotification('CSV exported successfully!', 'success');
-        }}
+        }
 
-        function processMarkdownForPDF(text) {{
+        function processMarkdownForPDF(text) {
             // Convert <br> tags to newlines
             text = text.replace(/<br\s*\/?>/gi, '\\n');
 
@@ -975,79 +2914,130 @@ def convert_markdown_table_to_html(md_file, html_file):
             text = text.replace(/^\s*>\s?/gm, '');
 
             // Convert headings ### Heading -> Heading (strip #)
-            text = text.replace(/^(#{{1,6}})\s*/gm, '');
+            text = text.replace(/^(#{1,6})\s*/gm, '');
 
             // Remove horizontal rules (--- or ***)
-            text = text.replace(/^(-{{3,}}|\*{{3,}})$/gm, '');
+            text = text.replace(/^(-{3,}|\*{3,})$/gm, '');
 
             // Replace non-breaking spaces and other Unicode spaces with regular space
             text = text.replace(/[\u00A0\u202F\u2007]/g, ' ');
 
             return text.trim();
-        }}
-
-        function exportToPDF() {{
+        }
+
+        // Parse one embedded Markdown table into autoTable header/body rows
+        function parsePdfTable(rawMd) {
+            const lines = rawMd.trim().split('\\n').filter(line => line.trim().startsWith('|'));
+            if (lines.length < 2) return null;
+
+            // Parse header row
+            const parseRow = (line) => {
+                return line
+                    .trim()
+                    .split('|')
+                    .slice(1, -1)
+                    .map(cell => processMarkdownForPDF(cell.trim()));
+            };
+
+            const header = parseRow(lines[0]);
+            const colCount = header.length;
+            const body = [];
+
+            // Process content rows (skip separator row at index 1)
+            for (let i = 2; i < lines.length; i++) {
+                const row = parseRow(lines[i]);
+
+                // Skip rows that don't match column count
+                if (row.length !== colCount) continue;
+
+                // Handle category rows (single non-empty cell in first column)
+                if (row[0].trim() !== '' && row.slice(1).every(cell => cell.trim() === '')) {
+                    body.push([{
+                        content: row[0],
+                        colSpan: colCount,
+                        styles: {
+                            fillColor: [240, 240, 240],
+                            textColor: [0, 0, 0],
+                            fontStyle: 'bold',
+                            halign: 'center',
+                            cellPadding: {
+                                top: 6,
+                                right: 4,
+                                bottom: 6,
+                                left: 4
+                            }
+                        }
+                    }]);
+                } else {
+                    body.push(row);
+                }
+            }
+
+            return { header, body };
+        }
+
+        // Pages name the PDF libraries' URLs (a CDN or the shared bundle), or
+        // offline pages carry them gzip-compressed. Nothing is loaded until
+        // the export menu is first opened.
+        let pdfLibraries = null;
+        function loadPdfLibraries() {
+            if (window.jspdf) return Promise.resolve();
+            const bundle = document.getElementById('pdf-libraries');
+            if (!bundle) return Promise.reject(new Error('PDF libraries are not available'));
+            if (!pdfLibraries) {
+                pdfLibraries = new Promise((resolve, reject) => {
+                    const script = document.createElement('script');
+                    if (bundle.dataset.src) {
+                        // In order: the autoTable plugin extends jsPDF
+                        const sources = JSON.parse(bundle.dataset.src);
+                        const loadNext = () => {
+                            if (!sources.length) return resolve();
+                            const next = document.createElement('script');
+                            const src = sources.shift();
+                            next.src = src;
+                            next.onload = loadNext;
+                            next.onerror = () => {
+                                // Let a later export try again
+                                pdfLibraries = null;
+                                reject(new Error('Could not load ' + src));
+                            };
+                            document.head.appendChild(next);
+                        };
+                        loadNext();
+                        return;
+                    }
+                    const bytes = Uint8Array.from(atob(bundle.textContent.trim()), c => c.charCodeAt(0));
+                    const code = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+                    new Response(code).text().then(text => {
+                        script.textContent = text;
+                        document.head.appendChild(script);
+                        resolve();
+                    }, reject);
+                });
+            }
+            return pdfLibraries;
+        }
+
+        function exportToPDF() {
             const spinner = document.getElementById('spinner');
             spinner.style.display = 'flex';
 
-            setTimeout(() => {{
-                try {{
-                    let rawMd = document.getElementById('original-md').textContent.trim();
-                    const lines = rawMd.split('\\n').filter(line => line.trim().startsWith('|'));
-                    
-                    if (lines.length < 2) {{
+            loadPdfLibraries().then(() => setTimeout(() => {
+                try {
+                    const tables = Array.from(document.querySelectorAll('.original-md'))
+                        .map(source => ({ heading: source.dataset.heading, table: parsePdfTable(source.textContent) }))
+                        .filter(entry => entry.table);
+
+                    if (tables.length === 0) {
                         throw new Error('Markdown table is invalid!');
-                    }}
-                    
-                    // Parse header row
-                    const parseRow = (line) => {{
-                        return line
-                            .trim()
-                            .split('|')
-                            .slice(1, -1)
-                            .map(cell => processMarkdownForPDF(cell.trim()));
-                    }};
-                    
-                    const header = parseRow(lines[0]);
-                    const colCount = header.length;
-                    const body = [];
-                    
-                    // Process content rows (skip separator row at index 1)
-                    for (let i = 2; i < lines.length; i++) {{
-                        const row = parseRow(lines[i]);
-                        
-                        // Skip rows that don't match column count
-                        if (row.length !== colCount) continue;
-                        
-                        // Handle category rows (single non-empty cell in first column)
-                        if (row[0].trim() !== '' && row.slice(1).every(cell => cell.trim() === '')) {{
-                            body.push([{{
-                                content: row[0],
-                                colSpan: colCount,
-                                styles: {{
-                                    fillColor: [240, 240, 240],
-                                    textColor: [0, 0, 0],
-                                    fontStyle: 'bold',
-                                    halign: 'center',
-                                    cellPadding: {{
-                                        top: 6,
-                                        right: 4,
-                                        bottom: 6,
-                                        left: 4
-                                    }}
-                                }}
-                            }}]);
-                        }} else {{
-                            body.push(row);
-                        }}
-                    }}
+                    }
                     
                     // Initialize PDF in landscape mode
-                    const {{ jsPDF }} = window.jspdf;
+                    const { jsPDF } = window.jspdf;
                     const doc = new jsPDF('landscape', 'pt', 'a4');
                     
                     // Set PDF title from filename
-                    const pdfTitle = "{pdf_title}";
+                    const pdfTitle = document.body.dataset.pdfTitle;
 
                     // Add title in Typora style
                     doc.setFontSize(18);
@@ -1059,93 +3049,113 @@ def convert_markdown_table_to_html(md_file, html_file):
                     doc.setLineWidth(0.5);
                     doc.line(40, 50, 555, 50);
                     
-                    // Generate table
-                    doc.autoTable({{
-                        head: [header],
-                        body: body,
-                        startY: 60,
-                        theme: 'grid',
-                        styles: {{
-                            fontSize: 9,
-                            cellPadding: {{
-                                top: 6,
-                                bottom: 6,
-                                left: 5,
-                                right: 5,
-                            }},
-                            overflow: 'linebreak',
-                            cellWidth: 'auto',
-                            valign: 'top',
-                            lineColor: [200, 200, 200],
-                            lineWidth: 0.3,
-                            textColor: [34, 34, 34],
-                            font: 'helvetica'
-                        }},
-                        headStyles: {{
-                            fillColor: [230, 230, 230],
-                            textColor: [0, 0, 0],
-                            fontStyle: 'bold',
-                            fontSize: 10,
-                            halign: 'center',
-                            valign: 'middle',
-                            cellPadding: {{ top: 7, bottom: 7, left: 5, right: 5 }},
-                            lineWidth: 0.3,
-                            lineColor: [180, 180, 180],
-                        }},
-                        bodyStyles: {{
-                            valign: 'top',
-                            lineWidth: 0.2,
-                            lineColor: [210, 210, 210],
-                        }},
-                        alternateRowStyles: {{
-                            fillColor: [245, 245, 245]
-                        }},
-                        margin: {{ 
-                            top: 10,
-                            left: 35,
-                            right: 35
-                        }},
-                        tableWidth: 'auto',
-                        showHead: 'everyPage',
-                        pageBreak: 'auto',
-                        rowPageBreak: 'avoid',
-                        tableLineWidth: 0.3,
-                        didDrawCell: function(data) {{
-                            doc.setDrawColor(220, 220, 220);
-                            doc.setLineWidth(0.3);
-                            doc.rect(data.cell.x, data.cell.y, data.cell.width, data.cell.height);
-                        }},
-                        didParseCell: function(data) {{
-                            if (data.row.section === 'body' && data.row.raw.length === 1) {{
-                                data.cell.styles.fillColor = [235, 240, 250];
-                                data.cell.styles.textColor = [0, 0, 70];
-                                data.cell.styles.fontStyle = 'bold';
-                                data.cell.styles.halign = 'center';
-                            }}
-                        }}
-                    }});
+                    // Generate one table per embedded Markdown table
+                    let startY = 60;
+                    tables.forEach(({ heading, table }) => {
+                        if (heading) {
+                            doc.setFontSize(13);
+                            doc.setFont(undefined, 'bold');
+                            doc.text(heading, 40, startY + 10);
+                            startY += 20;
+                        }
+                        doc.autoTable({
+                            head: [table.header],
+                            body: table.body,
+                            startY: startY,
+                            theme: 'grid',
+                            styles: {
+                                fontSize: 9,
+                                cellPadding: {
+                                    top: 6,
+                                    bottom: 6,
+                                    left: 5,
+                                    right: 5,
+                                },
+                                overflow: 'linebreak',
+                                cellWidth: 'auto',
+                                valign: 'top',
+                                lineColor: [200, 200, 200],
+                                lineWidth: 0.3,
+                                textColor: [34, 34, 34],
+                                font: 'helvetica'
+                            },
+                            headStyles: {
+                                fillColor: [230, 230, 230],
+                                textColor: [0, 0, 0],
+                                fontStyle: 'bold',
+                                fontSize: 10,
+                                halign: 'center',
+                                valign: 'middle',
+                                cellPadding: { top: 7, bottom: 7, left: 5, right: 5 },
+                                lineWidth: 0.3,
+                                lineColor: [180, 180, 180],
+                            },
+                            bodyStyles: {
+                                valign: 'top',
+                                lineWidth: 0.2,
+                                lineColor: [210, 210, 210],
+                            },
+                            alternateRowStyles: {
+                                fillColor: [245, 245, 245]
+                            },
+                            margin: { 
+                                top: 10,
+                                left: 35,
+                                right: 35
+                            },
+                            tableWidth: 'auto',
+                            showHead: 'everyPage',
+                            pageBreak: 'auto',
+                            rowPageBreak: 'avoid',
+                            tableLineWidth: 0.3,
+                            didDrawCell: function(data) {
+                                doc.setDrawColor(220, 220, 220);
+                                doc.setLineWidth(0.3);
+                                doc.rect(data.cell.x, data.cell.y, data.cell.width, data.cell.height);
+                            },
+                            didParseCell: function(data) {
+                                if (data.row.section === 'body' && data.row.raw.length === 1) {
+                                    data.cell.styles.fillColor = [235, 240, 250];
+                                    data.cell.styles.textColor = [0, 0, 70];
+                                    data.cell.styles.fontStyle = 'bold';
+                                    data.cell.styles.halign = 'center';
+                                }
+                            }
+                        });
+                        startY = doc.lastAutoTable.finalY + 30;
+                    });
                     
                     // Save PDF with filename-based name
-                    doc.save(`${{pdfTitle}}.pdf`);
+                    doc.save(`${pdfTitle}.pdf`);
                     showNotification("PDF exported successfully!", "success");
-                }} catch (error) {{
+                } catch (error) {
                     console.error("PDF export error:", error);
                     showNotification("PDF export failed: " + error.message, "error");
-                }} finally {{
+                } finally {
                     spinner.style.display = 'none';
-                }}
-            }}, 100);
-        }}
+                }
+            }, 100), () => {
+                // Without the PDF libraries, the browser's print dialog can still save a PDF
+                spinner.style.display = 'none';
+                window.print();
+            });
+        }
 
         
-        function copyToClipboard() {{
-            const tableHTML = document.querySelector('.table-container').innerHTML;
+        function copyToClipboard() {
+            const container = document.querySelector('.table-container').cloneNode(true);
+            // Virtualized tables only hold the visible rows; copy all of them
+            container.querySelectorAll('table.virtual-table').forEach(table => {
+                const state = virtualTables.find(entry => entry.table.id === table.id);
+                table.tBodies[0].innerHTML = state.rows.join('');
+            });
+            const tableHTML = container.innerHTML;
             navigator.clipboard.writeText(tableHTML)
                 .then(() => showNotification('HTML copied to clipboard!', 'success'))
                 .catch(err => showNotification('Failed to copy: ' + err, 'error'));
-        }}
+        }
         
-        function showNotification(message, type) {{
+        function showNotification(message, type) {
             // Create notification element
             const notification = document.createElement('div');
             notification.textContent = message;
@@ -1174,37 +3184,504 @@ def convert_markdown_table_to_html(md_file, html_file):
             document.body.appendChild(notification);
             
             // Animate in
-            setTimeout(() => {{
+            setTimeout(() => {
                 notification.style.opacity = '1';
                 notification.style.transform = 'translateX(-50%) translateY(-10px)';
-            }}, 10);
+            }, 10);
             
             // Animate out and remove after 3 seconds
-            setTimeout(() => {{
+            setTimeout(() => {
                 notification.style.opacity = '0';
                 notification.style.transform = 'translateX(-50%) translateY(20px)';
-                setTimeout(() => {{
+                setTimeout(() => {
                     document.body.removeChild(notification);
-                }}, 300);
-            }}, 3000);
-        }}
+                }, 300);
+            }, 3000);
+        }
 
         // Initialize density icon based on default compact view
         updateDensityIcon('compact');
-    </script>
-    <script id="original-md" type="text/plain">
-        {original_md}
-    </script>
-</body>
-</html>
 """
 
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(html_output)
-    print(f"✅ HTML export completed: {html_file}")
+class BuildCache:
+    """On-disk manifest of previous conversions, used to skip unchanged inputs.
+
+    Outputs are reused when they still have the size and mtime recorded when
+    they were written, were produced with the same options, and their input
+    either has the recorded size and mtime or the same SHA-256 content hash.
+    Outputs from a different converter build (see converter_fingerprint) are
+    never reused.
+    """
+
+    def __init__(self, manifest_path):
+        self.manifest_path = Path(manifest_path)
+        self.fingerprint = converter_fingerprint()
+        self.files = {}
+        self.dirty = False
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('fingerprint') == self.fingerprint:
+                self.files = manifest.get('files', {})
+        except (OSError, ValueError):
+            pass
+
+    def is_fresh(self, md_file, html_file, options=''):
+        """Return True if the outputs recorded for html_file are a valid conversion of md_file."""
+        entry = self.files.get(os.path.abspath(md_file))
+        if not entry or entry['html'] != os.path.abspath(html_file) or entry['options'] != options:
+            return False
+        try:
+            md_stat = os.stat(md_file)
+            for path, size, mtime_ns in entry['outputs']:
+                output_stat = os.stat(path)
+                if (output_stat.st_size, output_stat.st_mtime_ns) != (size, mtime_ns):
+                    return False
+        except OSError:
+            return False
+        if (md_stat.st_size, md_stat.st_mtime_ns) != (entry['size'], entry['mtime_ns']):
+            # Touched but possibly unchanged: fall back to the content hash
+            if md_stat.st_size != entry['size'] or _file_sha256(md_file) != entry['sha256']:
+                return False
+            entry['mtime_ns'] = md_stat.st_mtime_ns
+            self.dirty = True
+        return True
+
+    def record(self, md_file, html_file, outputs=None, options=''):
+        """Remember a successful conversion of md_file to html_file.
+
+        outputs lists every file written, when that is not just html_file.
+        """
+        md_stat = os.stat(md_file)
+        outputs = [html_file] if outputs is None else outputs
+        self.files[os.path.abspath(md_file)] = {
+            'sha256': _file_sha256(md_file),
+            'size': md_stat.st_size,
+            'mtime_ns': md_stat.st_mtime_ns,
+            'html': os.path.abspath(html_file),
+            'options': options,
+            'outputs': [[os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
+                        for path, stat in ((path, os.stat(path)) for path in outputs)],
+        }
+        self.dirty = True
+
+    def discard(self, md_file):
+        """Forget md_file, e.g. after a failed conversion."""
+        if self.files.pop(os.path.abspath(md_file), None) is not None:
+            self.dirty = True
+
+    def save(self):
+        """Write the manifest if it changed, replacing the old one atomically."""
+        if not self.dirty:
+            return
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'fingerprint': self.fingerprint, 'files': self.files}, f)
+        os.replace(tmp_path, self.manifest_path)
+        self.dirty = False
+
+def _file_sha256(path):
+    """Hash a file's content without reading it into memory at once."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+@lru_cache(maxsize=None)
+def converter_fingerprint():
+    """Identify this converter build; outputs recorded by another build are stale."""
+    digest = hashlib.sha256(CONVERTER_VERSION.encode('utf-8'))
+    try:
+        # Any change to the renderer or template invalidates the cache
+        digest.update(Path(__file__).read_bytes())
+    except OSError:
+        digest.update((_PAGE_TEMPLATE + _VIEWER_CSS + _VIEWER_JS).encode('utf-8'))
+    return digest.hexdigest()
+
+def collect_markdown_files(sources, out_dir=None):
+    """Expand directories, glob patterns and @manifest files into (md, html) path pairs.
+
+    Without out_dir each page is written next to its source file; with it,
+    paths below a source directory, or below the fixed leading directories of
+    a glob pattern, keep their relative layout. A file whose page would
+    overwrite another file's page is skipped with an error.
+    """
+    pairs = []
+    seen = set()
+
+    def add(md_path, rel_path):
+        md_path = Path(md_path)
+        key = md_path.resolve()
+        if key in seen:
+            return
+        seen.add(key)
+        if out_dir:
+            html_path = Path(out_dir) / Path(rel_path).with_suffix('.html')
+        else:
+            html_path = md_path.with_suffix('.html')
+        pairs.append((md_path, html_path))
+
+    for source in sources:
+        if source.startswith('@'):
+            # Manifest: one path, directory or pattern per line, '#' starts a comment
+            with open(source[1:], 'r', encoding='utf-8') as f:
+                entries = [line.strip() for line in f]
+            entries = [entry for entry in entries if entry and not entry.startswith('#')]
+            for md_path, html_path in collect_markdown_files(entries, out_dir):
+                if md_path.resolve() not in seen:
+                    seen.add(md_path.resolve())
+                    pairs.append((md_path, html_path))
+        elif os.path.isdir(source):
+            for md_path in sorted(Path(source).rglob('*.md')):
+                add(md_path, md_path.relative_to(source))
+        elif glob.has_magic(source):
+            root = _glob_root(source)
+            for match in sorted(glob.glob(source, recursive=True)):
+                if os.path.isfile(match):
+                    add(match, os.path.relpath(match, root))
+        elif os.path.isfile(source):
+            add(source, os.path.basename(source))
+        else:
+            print(f"Warning: '{source}' matched no files.")
+
+    outputs = {}
+    unique = []
+    for md_path, html_path in pairs:
+        key = html_path.resolve()
+        if key in outputs:
+            print(f"Error: '{md_path}' and '{outputs[key]}' would both be written to '{html_path}'; "
+                  f"skipping '{md_path}'.")
+            continue
+        outputs[key] = md_path
+        unique.append((md_path, html_path))
+    return unique
+
+def _glob_root(pattern):
+    """The leading directories of a glob pattern that contain no wildcards."""
+    parts = []
+    for part in Path(pattern).parts[:-1]:
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.path.join(*parts) if parts else '.'
+
+BatchResult = namedtuple('BatchResult', 'md_file html_file ok message seconds size cell_hits cell_misses pages')
+
+# Per-process cell memo for batch workers, shared by every file a worker converts
+_batch_cell_renderer = None
+
+def _convert_file(md_file, html_file, render_cell=process_cell_content, options=None, profile=None):
+    """Convert md_file in the table mode chosen by options and return the pages written."""
+    options = options or DEFAULT_OPTIONS
+    if options.page_rows:
+        pages = convert_markdown_table_to_pages(md_file, html_file, options.page_rows, render_cell, options,
+                                                profile)
+    elif options.tables is None:
+        ok = convert_markdown_table_to_html(md_file, html_file, render_cell, options, profile=profile)
+        pages = [html_file] if ok else []
+    else:
+        written = convert_markdown_tables_to_html(md_file, html_file, render_cell,
+                                                  split=options.tables == 'split', options=options,
+                                                  profile=profile)
+        pages = list(dict.fromkeys(page for page, _ in written))
+    return pages + [compressed for page in pages for compressed in compressed_copies(page, options)]
+
+def _convert_batch_item(pair, cell_cache=0, options=None):
+    """Process pool worker: convert one file and report the outcome."""
+    global _batch_cell_renderer
+    md_file, html_file = pair
+    render_cell = process_cell_content
+    hits = misses = 0
+    if cell_cache:
+        if _batch_cell_renderer is None or _batch_cell_renderer.cache_info().maxsize != cell_cache:
+            _batch_cell_renderer = cached_cell_renderer(cell_cache)
+        render_cell = _batch_cell_renderer
+        before = render_cell.cache_info()
+
+    start = time.perf_counter()
+    captured = io.StringIO()
+    pages = []
+    try:
+        html_file.parent.mkdir(parents=True, exist_ok=True)
+        with redirect_stdout(captured):
+            pages = _convert_file(md_file, html_file, render_cell, options)
+        ok = bool(pages)
+        message = captured.getvalue().strip()
+    except Exception as e:
+        ok, message = False, f"Error: {e}"
+    seconds = time.perf_counter() - start
+
+    if cell_cache:
+        after = render_cell.cache_info()
+        hits, misses = after.hits - before.hits, after.misses - before.misses
+    size = md_file.stat().st_size if ok else 0
+    return BatchResult(md_file, html_file, ok, message, seconds, size, hits, misses, pages)
+
+def convert_batch(pairs, jobs=None, cache=None, force=False, cell_cache=0, options=None):
+    """Convert (md, html) pairs across a process pool, printing per-file results.
+
+    With a BuildCache, pairs whose output is still valid are skipped unless
+    force is set. cell_cache > 0 gives each worker an LRU cell memo of that
+    size; options is an ExportOptions. Returns the number of files that failed.
+    """
+    options = options or DEFAULT_OPTIONS
+    jobs = jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    converted = failed = total_bytes = cell_hits = cell_misses = 0
+    convert_item = partial(_convert_batch_item, cell_cache=cell_cache, options=options)
+    cache_key = options.cache_key()
+
+    if cache is not None and not force:
+        todo = [pair for pair in pairs if not cache.is_fresh(*pair, options=cache_key)]
+    else:
+        todo = pairs
+    up_to_date = len(pairs) - len(todo)
+
+    if jobs == 1 or len(todo) < 2:
+        results = map(convert_item, todo)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        chunksize = max(1, len(todo) // (jobs * 8))
+        results = executor.map(convert_item, todo, chunksize=chunksize)
+
+    try:
+        for md_file, html_file, ok, message, seconds, size, hits, misses, pages in results:
+            cell_hits += hits
+            cell_misses += misses
+            if ok:
+                converted += 1
+                total_bytes += size
+                if cache is not None:
+                    cache.record(md_file, html_file, pages, cache_key)
+                targets = ', '.join(map(_output_label, pages[:_LISTED_OUTPUTS]))
+                if len(pages) > _LISTED_OUTPUTS:
+                    targets += f", and {len(pages) - _LISTED_OUTPUTS:,} more"
+                print(f"✅ {md_file} -> {targets} ({seconds * 1000:.1f} ms)")
+            else:
+                failed += 1
+                if cache is not None:
+                    cache.discard(md_file)
+                print(f"❌ {md_file}: {message}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if cache is not None:
+            cache.save()
+
+    elapsed = time.perf_counter() - start
+    rate = len(todo) / elapsed if elapsed else 0.0
+    mb_rate = total_bytes / (1024 * 1024) / elapsed if elapsed else 0.0
+    print(f"Converted {converted}/{len(todo)} files in {elapsed:.2f}s "
+          f"with {jobs} worker(s): {rate:.1f} files/s, {mb_rate:.1f} MB/s"
+          + (f", {failed} failed" if failed else ""))
+    if cache is not None:
+        print(f"Cache: {up_to_date} hits, {len(todo)} misses ({cache.manifest_path})")
+    if cell_cache:
+        _print_cell_cache_stats(cell_hits, cell_misses)
+    return failed
+
+# Outputs listed per file in batch results (paginated tables can write thousands)
+_LISTED_OUTPUTS = 8
+
+def _output_label(path):
+    """path as printed in batch results, with the ratio of a compressed copy to its page."""
+    path = Path(path)
+    if path.suffix not in [suffix for suffix, _ in COMPRESSION_FORMATS.values()]:
+        return str(path)
+    try:
+        ratio = path.stat().st_size / path.with_suffix('').stat().st_size
+    except (OSError, ZeroDivisionError):
+        return str(path)
+    return f"{path} ({ratio:.1%})"
+
+def _print_cell_cache_stats(hits, misses):
+    lookups = hits + misses
+    rate = hits / lookups * 100 if lookups else 0.0
+    print(f"Cell cache: {hits} hits, {misses} misses ({rate:.1f}% hit rate)")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Convert Markdown tables to interactive HTML pages.",
+        usage="%(prog)s input.md output.html\n"
+              "       %(prog)s --batch SOURCE [SOURCE ...] [--out-dir DIR] [--jobs N]\n"
+              "       %(prog)s --serve [[HOST:]PORT] [--jobs N] [--queue-size N]")
+    parser.add_argument('paths', nargs='*',
+                        help="input and output file, or with --batch: directories, "
+                             "glob patterns or @manifest files")
+    parser.add_argument('--batch', action='store_true',
+                        help="convert every Markdown file matched by the sources")
+    parser.add_argument('--out-dir', help="write batch output below this directory")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    parser.add_argument('--cache', action='store_true',
+                        help="skip inputs whose output is up to date, tracked in a manifest "
+                             f"({CACHE_MANIFEST_NAME} in --out-dir or the current directory)")
+    parser.add_argument('--cache-manifest', metavar='FILE',
+                        help="keep the --cache manifest in FILE instead (implies --cache)")
+    parser.add_argument('--force', action='store_true',
+                        help="with --cache, convert every input and refresh the manifest")
+    tables = parser.add_mutually_exclusive_group()
+    tables.add_argument('--all-tables', dest='tables', action='store_const', const='all',
+                        help="convert every table in the input into one page")
+    tables.add_argument('--split-tables', dest='tables', action='store_const', const='split',
+                        help="convert every table into its own page, named <output>-<n>.html")
+    parser.add_argument('--typed-columns', action='store_true',
+                        help="infer column types, right-align numbers and add a min/max/sum "
+                             "footer (loads each table into memory)")
+    parser.add_argument('--virtual', action='store_true',
+                        help="embed rows as data and keep only the rows near the viewport "
+                             "in the page (for very large tables)")
+    parser.add_argument('--search-index', action='store_true',
+                        help="embed a trigram index so the viewer's search only checks "
+                             "matching rows (larger page, faster search)")
+    parser.add_argument('--offline', action='store_true',
+                        help="make pages that load nothing from the network: inline the icons "
+                             f"and the PDF libraries found in {VENDOR_DIR.name}/")
+    parser.add_argument('--shared-assets', metavar='DIR',
+                        help="write viewer.css and viewer.js (with --offline, also the icons and "
+                             "PDF libraries) once into DIR and link every page to them")
+    parser.add_argument('--compress', metavar='FORMATS',
+                        help="also write compressed copies of each page, e.g. gzip,br; auto "
+                             "writes gzip, and br when the brotli package is installed")
+    parser.add_argument('--compress-level', type=int, metavar='LEVEL',
+                        help="compression level (default and cap: 9 for gzip, 11 for br)")
+    parser.add_argument('--page-rows', type=int, metavar='N',
+                        help="split the first table into linked pages of N rows, <output>-0001.html, "
+                             "..., with <output> as their index")
+    parser.add_argument('--render-jobs', type=int, default=1, metavar='N',
+                        help="render the rows of one large table in N processes, 0 for one per CPU "
+                             "(not with --batch or --typed-columns)")
+    parser.add_argument('--cell-cache', type=int, default=0, metavar='SIZE',
+                        help=f"memoize rendered cells in an LRU of SIZE entries, e.g. {CELL_CACHE_SIZE}")
+    parser.add_argument('--profile', action='store_true',
+                        help="print the time spent in each conversion stage")
+    parser.add_argument('--profile-json', metavar='FILE',
+                        help="write the stage timings as JSON to FILE ('-' for standard output)")
+    parser.add_argument('--watch', action='store_true',
+                        help="after converting, convert each input again whenever it changes")
+    parser.add_argument('--serve', nargs='?', const='', metavar='[HOST:]PORT',
+                        help="serve conversions over HTTP (see md_table_server.py); "
+                             "export options are chosen per request")
+    parser.add_argument('--queue-size', type=int, default=None,
+                        help="with --serve, requests accepted at once before answering 503")
+    args = parser.parse_args(argv)
+    if args.render_jobs < 0 or args.cell_cache < 0:
+        parser.error("--render-jobs and --cell-cache take a number of 0 or more")
+    args.cache = args.cache or args.cache_manifest is not None
+    if args.render_jobs != 1 and args.typed_columns:
+        parser.error("--render-jobs cannot be combined with --typed-columns, "
+                     "which loads each table into memory")
+
+    if args.serve is not None:
+        import md_table_server
+        host, _, port = args.serve.rpartition(':')
+        server_args = ['--host', host or md_table_server.DEFAULT_HOST]
+        server_args += ['--port', port or str(md_table_server.DEFAULT_PORT)]
+        if args.jobs:
+            server_args += ['--jobs', str(args.jobs)]
+        if args.queue_size:
+            server_args += ['--queue-size', str(args.queue_size)]
+        return md_table_server.main(server_args)
+
+    compress = ()
+    if args.compress == 'auto':
+        compress = available_compression_formats()
+    elif args.compress:
+        compress = [name.strip() for name in args.compress.split(',') if name.strip()]
+        unknown = [name for name in compress if name not in COMPRESSION_FORMATS]
+        if unknown:
+            print(f"Error: Unknown compression format '{unknown[0]}'; "
+                  f"choose from {', '.join(COMPRESSION_FORMATS)}.")
+            return 2
+        if 'br' in compress and brotli is None:
+            print("Error: br output needs the brotli package (pip install brotli).")
+            return 2
+
+    options = ExportOptions(tables=args.tables, typed_columns=args.typed_columns,
+                            virtual=args.virtual, search_index=args.search_index,
+                            offline=args.offline, asset_dir=args.shared_assets,
+                            compress=compress, compress_level=args.compress_level,
+                            render_jobs=args.render_jobs or os.cpu_count() or 1,
+                            page_rows=args.page_rows)
+    if options.offline and not offline_pdf_libraries():
+        print(f"Note: {', '.join(PDF_LIBRARIES)} not found in {VENDOR_DIR}; "
+              "offline pages export PDFs through the browser's print dialog.", file=sys.stderr)
+    if args.shared_assets:
+        write_shared_assets(args.shared_assets, options.offline)
+
+    if (args.profile or args.profile_json) and (args.batch or args.watch or args.cache):
+        print("Error: --profile times a single conversion; it cannot be combined with "
+              "--batch, --watch or --cache.")
+        return 2
+
+    if args.page_rows is not None and (args.page_rows < 1 or args.tables or args.typed_columns):
+        print("Error: --page-rows takes a positive number of rows and paginates the first table only; "
+              "it cannot be combined with --all-tables, --split-tables or --typed-columns.")
+        return 2
+
+    if args.render_jobs != 1 and (args.batch or args.profile or args.profile_json):
+        print("Error: --render-jobs splits a single table across processes; use --jobs with --batch, "
+              "and profile without it.")
+        return 2
+
+    cache = None
+    if args.cache_manifest:
+        cache = BuildCache(Path(args.cache_manifest))
+    elif args.cache:
+        cache = BuildCache(Path(args.out_dir or '.') / CACHE_MANIFEST_NAME)
+
+    if args.watch:
+        import md_table_watch
+        if args.batch:
+            return md_table_watch.watch(args.paths, args.out_dir, cache=cache,
+                                        cell_cache=args.cell_cache, options=options)
+        if len(args.paths) != 2:
+            parser.print_usage()
+            return 2
+        return md_table_watch.watch(args.paths[:1], pair=tuple(map(Path, args.paths)), cache=cache,
+                                    cell_cache=args.cell_cache, options=options)
+
+    if args.batch:
+        if not args.paths:
+            parser.print_usage()
+            return 2
+        pairs = collect_markdown_files(args.paths, args.out_dir)
+        if not pairs:
+            print("Error: No Markdown files found.")
+            return 1
+        return 1 if convert_batch(pairs, args.jobs, cache, args.force, args.cell_cache, options) else 0
+
+    if len(args.paths) != 2:
+        parser.print_usage()
+        return 2
+    profile = ConversionProfile() if args.profile or args.profile_json else None
+    if cache is not None:
+        pairs = [tuple(map(Path, args.paths))]
+        return 1 if convert_batch(pairs, 1, cache, args.force, args.cell_cache, options) else 0
+    render_cell = cached_cell_renderer(args.cell_cache) if args.cell_cache else process_cell_content
+    # JSON on standard output is for other programs; status messages go to stderr
+    with redirect_stdout(sys.stderr) if args.profile_json == '-' else nullcontext():
+        pages = _convert_file(*args.paths, render_cell, options, profile)
+        if args.cell_cache and args.render_jobs == 1:
+            # With --render-jobs the cells are rendered, and counted, in the workers
+            info = render_cell.cache_info()
+            _print_cell_cache_stats(info.hits, info.misses)
+    if profile is not None and pages:
+        _write_profile(profile, args.profile, args.profile_json)
+    return 0 if pages else 1
+
+def _write_profile(profile, report, json_file):
+    if report:
+        profile.report(sys.stderr if json_file == '-' else None)
+    if json_file == '-':
+        print(json.dumps(profile.to_dict(), indent=2))
+    elif json_file:
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(profile.to_dict(), f, indent=2)
+            f.write('\n')
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python md_table_to_html.py input.md output.html")
-    else:
-        convert_markdown_table_to_html(sys.argv[1], sys.argv[2])
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""Watch Markdown files and re-export their tables when they change.
+
+Changes are found by comparing (mtime, size) snapshots of the watched
+inputs. On Linux an inotify backend wakes the loop as soon as a watched
+directory changes; elsewhere the snapshots are polled every POLL_INTERVAL.
+A burst of saves is debounced into one rebuild, and only the files whose
+snapshot changed are converted again.
+
+    python md_table_to_html.py input.md output.html --watch
+    python md_table_to_html.py --batch docs/ --out-dir site/ --watch
+"""
+
+import os
+import time
+import ctypes
+import ctypes.util
+import select
+import struct
+from pathlib import Path
+
+from md_table_to_html import collect_markdown_files, convert_batch
+
+# Seconds between snapshots when polling
+POLL_INTERVAL = 0.05
+# A change is converted once the inputs stay unchanged this long...
+DEBOUNCE = 0.03
+# ...or once it has waited this long, for files that keep changing
+MAX_DEBOUNCE = 1.0
+# Seconds between checks for new or deleted files when polling
+RESCAN_INTERVAL = 1.0
+
+def snapshot(paths):
+    """Return {path: (mtime_ns, size)} for the paths that still exist."""
+    state = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        state[path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+class PollingBackend:
+    """Wake the watch loop every POLL_INTERVAL; rescan every RESCAN_INTERVAL."""
+
+    name = 'polling'
+
+    def __init__(self, interval=POLL_INTERVAL):
+        self.interval = interval
+        self.next_rescan = time.monotonic() + RESCAN_INTERVAL
+
+    def watch(self, directories):
+        pass
+
+    def wait(self):
+        """Sleep one interval; return True when files may have been added or removed."""
+        time.sleep(self.interval)
+        if time.monotonic() < self.next_rescan:
+            return False
+        self.next_rescan = time.monotonic() + RESCAN_INTERVAL
+        return True
+
+    def close(self):
+        pass
+
+class InotifyBackend:
+    """Block until a watched directory changes, using Linux inotify through ctypes."""
+
+    name = 'inotify'
+
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    # Events that can add or remove an input
+    RESCAN_MASK = IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self, libc, fd):
+        self.libc = libc
+        self.fd = fd
+        self.watched = set()
+
+    @classmethod
+    def create(cls):
+        """Return an InotifyBackend, or None where inotify is unavailable."""
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            return None
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            init = libc.inotify_init1
+        except (OSError, AttributeError):
+            return None
+        fd = init(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        return cls(libc, fd)
+
+    def watch(self, directories):
+        for directory in directories:
+            if directory in self.watched:
+                continue
+            if self.libc.inotify_add_watch(self.fd, os.fsencode(directory), self.WATCH_MASK) >= 0:
+                self.watched.add(directory)
+
+    def wait(self):
+        """Block until events arrive; return True when files may have been added or removed."""
+        select.select([self.fd], [], [])
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        rescan = False
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if mask & self.RESCAN_MASK and (mask & self.IN_ISDIR or name.endswith(b'.md')):
+                rescan = True
+        return rescan
+
+    def close(self):
+        os.close(self.fd)
+
+def _watch_directories(sources, pairs):
+    """Directories whose changes can affect the inputs: every source tree and each input's folder."""
+    directories = {str(md_file.parent.resolve()) for md_file, _ in pairs}
+    for source in sources:
+        if os.path.isdir(source):
+            directories.add(str(Path(source).resolve()))
+            directories.update(str(path.resolve()) for path in Path(source).rglob('*') if path.is_dir())
+    return directories
+
+def watch(sources, out_dir=None, pair=None, cache=None, cell_cache=0, options=None):
+    """Convert the inputs, then convert each one again whenever it changes.
+
+    Inputs are the (md, html) pair given as pair, or else everything
+    collect_markdown_files finds in sources; new files in source directories
+    are picked up as they appear. Runs until interrupted.
+    """
+    def collect():
+        return [pair] if pair else collect_markdown_files(sources, out_dir)
+
+    backend = InotifyBackend.create() or PollingBackend()
+    try:
+        pairs = dict(collect())
+        convert_batch(list(pairs.items()), cache=cache, cell_cache=cell_cache, options=options)
+        backend.watch(_watch_directories(sources, pairs.items()))
+        known = snapshot(pairs)
+        print(f"Watching {len(pairs)} file(s) with {backend.name}; press Ctrl+C to stop.")
+
+        while True:
+            if backend.wait() and not pair:
+                pairs = dict(collect())
+                backend.watch(_watch_directories(sources, pairs.items()))
+            current = snapshot(pairs)
+            changed = [md_file for md_file, state in current.items() if known.get(md_file) != state]
+            if not changed:
+                known = current
+                continue
+
+            # Debounce: let a burst of saves settle before converting
+            settled = {md_file: current[md_file] for md_file in changed}
+            deadline = time.monotonic() + MAX_DEBOUNCE
+            while time.monotonic() < deadline:
+                time.sleep(DEBOUNCE)
+                latest = snapshot(changed)
+                if latest == settled:
+                    break
+                settled = latest
+            for md_file in changed:
+                if md_file in settled:
+                    current[md_file] = settled[md_file]
+                else:
+                    current.pop(md_file, None)
+
+            changed = list(settled)
+            convert_batch([(md_file, pairs[md_file]) for md_file in changed], jobs=1, cache=cache,
+                          force=True, cell_cache=cell_cache, options=options)
+            known = current
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    finally:
+        backend.close()
+    return 0
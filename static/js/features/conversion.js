@@ -1,12 +1,59 @@
 // features/conversion.js - Enhanced Conversion with Spring Animations
 
 import { AppState, Elements } from '../core/state.js';
-import { showLoading, hideLoading } from './loading.js';
+import { showLoading, hideLoading, updateLoadingMessage } from './loading.js';
 import { showSnackbar } from './feedback.js';
 import { addSuccessAnimation, animateProgress, animateConversionProcess } from '../core/motion.js';
 import { SpringUtils, SpringPerformance } from '../core/spring-physics.js';
 import { updateUI, updateStatus, showResultCard, hideResultCard } from './ui-updates.js';
 
+// How often a running conversion job is polled for progress
+const POLL_INTERVAL_MS = 200;
+
+// Job ID of the conversion running in the background, if any
+let currentJobId = null;
+
+// Start a conversion job and poll it until it finishes
+async function runConversionJob() {
+    const started = JSON.parse(await pywebview.api.start_conversion());
+    if (started.status !== 'running') {
+        return started;
+    }
+    
+    currentJobId = started.job_id;
+    try {
+        while (true) {
+            await new Promise(resolve => setTimeout(resolve, POLL_INTERVAL_MS));
+            const job = JSON.parse(await pywebview.api.poll_conversion(currentJobId));
+            if (job.status !== 'running') {
+                return job;
+            }
+            showConversionProgress(job);
+        }
+    } finally {
+        currentJobId = null;
+    }
+}
+
+function showConversionProgress(job) {
+    let message = job.message;
+    if (job.total_rows > 0 && job.rows_done > 0) {
+        const percent = Math.min(100, Math.round(job.rows_done / job.total_rows * 100));
+        message = `Converting rows: ${job.rows_done.toLocaleString()} / ${job.total_rows.toLocaleString()} (${percent}%)`;
+    }
+    updateLoadingMessage(message);
+}
+
+// Ask the running conversion job to stop
+export async function cancelConversion() {
+    if (!currentJobId) {
+        return;
+    }
+    
+    updateLoadingMessage('Cancelling conversion...');
+    await pywebview.api.cancel_conversion(currentJobId);
+}
+
 // Enhanced Convert Function with Spring Physics
 export async function convertTable() {
     if (AppState.isConverting || !AppState.inputFile) {
@@ -14,7 +61,7 @@ export async function convertTable() {
     }
     
     // Check if pywebview is available
-    if (typeof pywebview === 'undefined' || !pywebview.api || !pywebview.api.convert_table) {
+    if (typeof pywebview === 'undefined' || !pywebview.api || !pywebview.api.start_conversion) {
         showSnackbar('Conversion not available in browser mode', 'error');
         return;
     }
@@ -26,8 +73,7 @@ export async function convertTable() {
     await startConversionAnimation();
     
     try {
-        const result = await pywebview.api.convert_table();
-        const response = JSON.parse(result);
+        const response = await runConversionJob();
         
         await completeConversionAnimation(response.status === 'success');
         
@@ -46,6 +92,10 @@ export async function convertTable() {
                 }
             }, 15000);
             
+        } else if (response.status === 'cancelled') {
+            updateStatus('Conversion cancelled', 'info', 'cancel');
+            showSnackbar('Conversion cancelled', 'info');
+            
         } else {
             updateStatus('Conversion failed', 'error', 'error');
             showSnackbar(response.message || 'Conversion failed', 'error');
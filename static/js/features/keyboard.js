@@ -1,6 +1,7 @@
 // features/keyboard.js - Keyboard Shortcut Handler
 
 import { CommandSystem } from './command-system.js';
+import { cancelConversion } from './conversion.js';
 
 // Keyboard Shortcuts
 export function handleKeyboardShortcuts(e) {
@@ -47,6 +48,8 @@ export function handleKeyboardShortcuts(e) {
     switch (key) {
         case 'escape':
             CommandSystem.hideCommandPalette();
+            // Stop a running conversion
+            cancelConversion();
             // Also close dialogs
             const dialogContainer = document.getElementById('dialog-container');
             if (dialogContainer && !dialogContainer.classList.contains('hidden')) {
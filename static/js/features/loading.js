@@ -15,6 +15,13 @@ export function showLoading(message = 'Processing...') {
     document.body.style.overflow = 'hidden';
 }
 
+export function updateLoadingMessage(message) {
+    const loadingMessage = Elements.loadingOverlay?.querySelector('#loading-message');
+    if (loadingMessage) {
+        loadingMessage.textContent = message;
+    }
+}
+
 export function hideLoading() {
     if (!Elements.loadingOverlay) return;
     
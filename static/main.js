@@ -6,7 +6,7 @@ import { setupMotionSystem, showWelcomeAnimation } from './js/core/motion.js';
 
 // Feature imports
 import { selectSourceFile, selectOutputFolder } from './js/features/file-operations.js';
-import { convertTable } from './js/features/conversion.js';
+import { convertTable, cancelConversion } from './js/features/conversion.js';
 import { toggleTheme, initializeTheme } from './js/features/theme.js';
 import { showHelpDialog } from './js/features/feedback.js';
 import { setupDragAndDrop } from './js/features/drag-drop.js';
@@ -64,6 +64,8 @@ function setupEventListeners() {
         Elements.convertBtn.addEventListener('click', convertTable);
     }
     
+    document.getElementById('cancel-conversion-btn')?.addEventListener('click', cancelConversion);
+    
     // Upload zone click
     if (Elements.uploadZone) {
         Elements.uploadZone.addEventListener('click', selectSourceFile);
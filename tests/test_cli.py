@@ -0,0 +1,54 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, 'md_table_to_html.py')
+
+TABLE = '| Name | Value |\n|---|---|\n| **Group** | |\n| a | 1 |\n| b | 2 |\n'
+
+class CommandLineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.md_file = os.path.join(self.tmp.name, 'in.md')
+        self.html_file = os.path.join(self.tmp.name, 'out.html')
+        with open(self.md_file, 'w', encoding='utf-8') as f:
+            f.write(TABLE)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def run_cli(self, *args):
+        return subprocess.run([sys.executable, SCRIPT, *args], capture_output=True, text=True,
+                              encoding='utf-8', cwd=self.tmp.name)
+
+    def test_profile_json_on_stdout_is_only_json(self):
+        result = self.run_cli(self.md_file, self.html_file, '--profile', '--profile-json', '-', '--offline')
+        self.assertEqual(result.returncode, 0, result.stderr)
+        profile = json.loads(result.stdout)
+        self.assertEqual(profile['rows'], 3)
+        self.assertIn('HTML export completed', result.stderr)
+
+    def test_value_flags_before_the_paths(self):
+        result = self.run_cli('--cell-cache', '64', '--render-jobs', '2', '--compress', 'gzip', '--cache',
+                              self.md_file, self.html_file)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        self.assertTrue(os.path.exists(self.html_file + '.gz'))
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, '.md_table_cache.json')))
+        with open(self.md_file, encoding='utf-8') as f:
+            self.assertEqual(f.read(), TABLE)
+
+    def test_page_index_links_open_in_the_same_tab(self):
+        result = self.run_cli(self.md_file, self.html_file, '--page-rows', '2')
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+        with open(self.html_file, encoding='utf-8') as f:
+            index = f.read()
+        self.assertIn('<a href="out-0001.html">out-0001</a>', index)
+        self.assertNotIn('target="_blank"', index)
+
+if __name__ == '__main__':
+    unittest.main()
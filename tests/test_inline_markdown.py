@@ -0,0 +1,40 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from md_table_to_html import process_cell_content
+
+# Output of the original regex cascade for the documented cell syntax
+BASELINE_OUTPUT = {
+    '_a __b__ c_': '<em>a <strong>b</strong> c</em>',
+    '__a _b_ c__': '<strong>a <em>b</em> c</strong>',
+    '_a_ __b__ _c_': '<em>a</em> <strong>b</strong> <em>c</em>',
+    '__bold__ and _italic_': '<strong>bold</strong> and <em>italic</em>',
+    '_foo__': '<em>foo</em>_',
+    'snake_case_name': 'snake<em>case</em>name',
+    '**[docs](u)**': '<strong><a href="u" target="_blank">docs</a></strong>',
+    '`Code snippets`': '<code>Code snippets</code>',
+    '~~Strikethrough~~': '<del>Strikethrough</del>',
+    'Line<br>breaks': 'Line<br>breaks',
+    '> quoted': '<blockquote>quoted</blockquote>',
+    '### Heading': '<strong>Heading</strong>',
+}
+
+class InlineMarkdownTest(unittest.TestCase):
+
+    def test_matches_the_original_renderer(self):
+        for text, expected in BASELINE_OUTPUT.items():
+            with self.subTest(text=text):
+                self.assertEqual(process_cell_content(text), expected)
+
+    def test_bold_inside_star_italic(self):
+        # The original renderer never closed *italic*; it now nests like _italic_
+        self.assertEqual(process_cell_content('*a **b** c*'), '<em>a <strong>b</strong> c</em>')
+        self.assertEqual(process_cell_content('**a *b* c**'), '<strong>a <em>b</em> c</strong>')
+        self.assertEqual(process_cell_content('*a* **b** *c*'), '<em>a</em> <strong>b</strong> <em>c</em>')
+        self.assertEqual(process_cell_content('*a**'), '<em>a</em>*')
+
+if __name__ == '__main__':
+    unittest.main()
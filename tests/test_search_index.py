@@ -0,0 +1,55 @@
+import json
+import os
+import re
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from md_table_to_html import ExportOptions, convert_to_string
+
+TABLE = """| Name | Rule |
+|---|---|
+| x < 5 | a > b |
+| AT&T | Tom &amp; Jerry |
+| **Group** | |
+| <b>bold</b> & co | 1 <2 |
+| plain | 3 > 2 < 1 |
+"""
+
+def candidate_rows(page, term):
+    """Rows the viewer would check for term, looked up in the page's embedded index."""
+    found = re.search(r'<script type="application/json" class="search-index"[^>]*>(.*?)</script>', page, re.S)
+    index = json.loads(found.group(1))
+    gram = index['gram']
+    keys = [term] if len(term) < gram else [term[i:i + gram] for i in range(len(term) - gram + 1)]
+    rows = None
+    for key in keys:
+        deltas = index['postings'].get(key, [])
+        listed, total = set(), 0
+        for delta in deltas:
+            total += delta
+            listed.add(total)
+        rows = listed if rows is None else rows & listed
+    return rows
+
+class SearchIndexTest(unittest.TestCase):
+
+    def check(self, options):
+        page = convert_to_string(TABLE, options=options).html
+        # Body rows, counting the category row at 2
+        for term, row in (('x < 5', 0), ('< 5', 0), ('a > b', 0), ('at&t', 1), ('tom & jerry', 1),
+                          ('bold & co', 3), ('1 <2', 3), ('3 > 2 < 1', 4), ('plain', 4)):
+            with self.subTest(term=term):
+                self.assertIn(row, candidate_rows(page, term))
+        self.assertNotIn(2, candidate_rows(page, 'group'))
+        self.assertEqual(candidate_rows(page, 'x < 5'), {0})
+
+    def test_special_characters_are_indexed_per_cell(self):
+        self.check(ExportOptions(search_index=True))
+
+    def test_typed_columns(self):
+        self.check(ExportOptions(search_index=True, typed_columns=True))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import functools
+import io
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from md_table_server import ConversionServer
+
+TABLE = b'| Name | Value |\n|---|---|\n| a | 1 |\n'
+
+def with_server(test):
+    """Run an async test method on its own event loop, against a server started for it.
+
+    (unittest.IsolatedAsyncioTestCase would need Python 3.8.)
+    """
+    @functools.wraps(test)
+    def run(self):
+        async def serve():
+            self.server = ConversionServer(jobs=1, log=io.StringIO())
+            listener = await self.server.start('127.0.0.1', 0)
+            self.port = listener.sockets[0].getsockname()[1]
+            try:
+                await test(self)
+            finally:
+                listener.close()
+                await listener.wait_closed()
+                self.server.close()
+        asyncio.run(serve())
+    return run
+
+class ConversionServerTest(unittest.TestCase):
+
+    async def request(self, target, body=TABLE, length=None, headers=''):
+        """Send one Connection: close request and read the response until the server closes."""
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        length = len(body) if length is None else length
+        writer.write(f'POST {target} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n{headers}'
+                     f'Content-Length: {length}\r\n\r\n'.encode('latin-1') + body)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 30)
+        writer.close()
+        head, _, payload = response.partition(b'\r\n\r\n')
+        return int(head.split()[1]), payload
+
+    @with_server
+    async def test_connection_close_ends_the_stream(self):
+        status, payload = await self.request('/fragment')
+        self.assertEqual(status, 200)
+        self.assertIn(b'<td> 1</td>', payload)
+
+    @with_server
+    async def test_hostile_name_is_escaped(self):
+        status, payload = await self.request('/page?name=%3Cscript%3Ealert(1)%3C/script%3E.md')
+        self.assertEqual(status, 200)
+        self.assertNotIn(b'<script>alert(1)</script>', payload)
+        self.assertIn(b'&lt;script&gt;alert(1)&lt;/script&gt;.md', payload)
+
+    @with_server
+    async def test_negative_content_length_is_rejected(self):
+        status, payload = await self.request('/page', body=b'', length=-5)
+        self.assertEqual(status, 400)
+        self.assertEqual(json.loads(payload)['error'], 'bad_request')
+
+    @with_server
+    async def test_over_long_header_is_rejected(self):
+        status, payload = await self.request('/page', headers=f'X-Long: {"a" * 100000}\r\n')
+        self.assertEqual(status, 400)
+        self.assertEqual(json.loads(payload)['error'], 'bad_request')
+
+    @with_server
+    async def test_busy_server_refuses_before_reading_the_body(self):
+        self.server.queue_size = 0
+        # The body never arrives: the answer cannot wait for it
+        status, payload = await self.request('/page', body=b'', length=1000000)
+        self.assertEqual(status, 503)
+        self.assertEqual(json.loads(payload)['error'], 'busy')
+
+if __name__ == '__main__':
+    unittest.main()
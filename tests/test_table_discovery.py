@@ -0,0 +1,63 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from md_table_to_html import iter_mapped_tables, iter_markdown_tables
+
+DOCUMENT = """# Real
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+```markdown
+# Not a heading
+| x | y |
+|---|---|
+```
+
+~~~~
+```
+| still | code |
+~~~
+~~~~
+
+## Second
+
+| c | d |
+|---|---|
+
+``` not a fence: `backticks` in the info string
+| e | f |
+|---|---|
+
+```
+| in | a fence left open |
+"""
+
+EXPECTED = [(3, 5, 'Real', '| a | b |'), (21, 22, 'Second', '| c | d |'), (25, 26, 'Second', '| e | f |')]
+
+class TableDiscoveryTest(unittest.TestCase):
+
+    def test_lines_skip_fenced_code(self):
+        found = []
+        for table in iter_markdown_tables(DOCUMENT.split('\n')):
+            lines = list(table.lines)
+            found.append((table.start_line, table.end_line, table.heading, lines[0]))
+        self.assertEqual(found, EXPECTED)
+
+    def test_mapped_file_skips_fenced_code(self):
+        for newline in ('\n', '\r\n'):
+            with self.subTest(newline=repr(newline)), tempfile.TemporaryDirectory() as tmp:
+                md_file = os.path.join(tmp, 'doc.md')
+                with open(md_file, 'w', encoding='utf-8', newline=newline) as f:
+                    f.write(DOCUMENT)
+                found = [(table.start_line, table.end_line, table.heading, next(table.lines))
+                         for table in iter_mapped_tables(md_file)]
+                self.assertEqual(found, EXPECTED)
+
+if __name__ == '__main__':
+    unittest.main()
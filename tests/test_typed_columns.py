@@ -0,0 +1,38 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from md_table_to_html import ColumnarTable, process_cell_content
+
+def typed_table(*columns):
+    """A ColumnarTable over a name column followed by the given columns of cell texts."""
+    names = [f'row {number}' for number in range(len(columns[0]))]
+    header = [f'c{index}' for index in range(len(columns) + 1)]
+    return ColumnarTable(header, [list(row) for row in zip(names, *columns)])
+
+class TypedColumnsTest(unittest.TestCase):
+
+    def test_numeric_cells_are_shown_as_written(self):
+        table = typed_table(['+1', '2', '1,250', '-3'], ['1.5e3', '2', '0.25', ''])
+        self.assertEqual(table.types, ['text', 'int', 'float'])
+        self.assertEqual(table.render_cells(1, process_cell_content),
+                         ['<td class="num">+1</td>', '<td class="num">2</td>',
+                          '<td class="num">1,250</td>', '<td class="num">-3</td>'])
+        self.assertEqual(table.render_cells(2, process_cell_content),
+                         ['<td class="num">1.5e3</td>', '<td class="num">2</td>',
+                          '<td class="num">0.25</td>', '<td class="num"></td>'])
+        self.assertEqual(table.summary(1), ('-3', '1,250', '1,250'))
+
+    def test_values_that_would_change_stay_text(self):
+        for column in (['007', '12'], ['1,2,3', '4'], ['12345678901234567890123', '1'],
+                       ['1e400', '1'], ['0.1000000000000000055511151231257827', '1']):
+            with self.subTest(column=column):
+                table = typed_table(column)
+                self.assertEqual(table.types, ['text', 'text'])
+                self.assertEqual(table.render_cells(1, process_cell_content),
+                                 [f'<td>{cell}</td>' for cell in column])
+
+if __name__ == '__main__':
+    unittest.main()